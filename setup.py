@@ -75,6 +75,6 @@ setup(
         "pyparsing>=2.4.7",
         "python-dateutil>=2.8.1",
         "six>=1.15.0",
-        "sympy>=1.6.2",
+        "sympy>=1.9",
     ],
 )
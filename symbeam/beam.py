@@ -12,6 +12,12 @@ SymBeam furnishes to the outside world.
 
 ..moduleauthor:: A. M. Couto Carneiro <amcc@fe.up.pt>
 """
+import bisect
+import functools
+import itertools
+import linecache
+import sys
+
 import matplotlib.pyplot as plt
 import matplotlib.ticker as ticker
 import numpy as np
@@ -19,12 +25,31 @@ import sympy as sym
 
 from sympy.abc import E, I, x
 
-from symbeam.load import distributed_load, point_load, point_moment
-from symbeam.point import continuity, fixed, hinge, pin, roller
+from symbeam.load import _sympify, distributed_load, point_load, point_moment
+from symbeam.point import (
+    continuity,
+    draw_points,
+    fixed,
+    get_plot_context,
+    hinge,
+    pin,
+    roller,
+)
 
 
 # Set numerical tolerance
 tol = 1e-6
+
+# Reference plotting grids in [0, 1], mapped onto each segment. Segments where all diagrams
+# are linear are exactly represented by their end points.
+_PLOT_GRID = np.linspace(0.0, 1.0, num=100, endpoint=True)
+_PLOT_GRID_LINEAR = np.array([0.0, 1.0])
+
+# Row templates of the output tables
+_ROW_3 = "{0:^27} {1:^27} {2:^27}".format
+_ROW_4 = "{0:^20} {1:^20} {2:^20} {3:^20}".format
+_ROW_EXPRESSION = "{0:^20} {1:^10} {2:^50}".format
+_SPAN = "[ {0:^5} - {1:^5} ]".format
 # ===================================================================================== beam
 class beam:
     """Beam main class.
@@ -51,16 +76,18 @@ class beam:
         program cannot complete, as several solutions could arise to the problem.
         """
         # Initialise the length and startig point of the beam.
-        self.length = sym.sympify(length)
-        self.x0 = sym.sympify(x0)
+        self.length = _sympify(length)
+        self.x0 = _sympify(x0)
 
         # Check the consitency of the input. Only one symbol is permitted for the geometry
-        # definition, in order to facilitate the creation of the segments.
+        # definition, in order to facilitate the creation of the segments. The symbols of
+        # the input are gathered once.
+        length_symbols = self.length.free_symbols
+        x0_symbols = self.x0.free_symbols
+
         # If the beam starts at zero it's fine.
-        starts_at_zero = self.x0 == sym.sympify(0)
-        if len(self.length.free_symbols) != len(self.x0.free_symbols) and not (
-            starts_at_zero
-        ):
+        starts_at_zero = self.x0 == sym.S.Zero
+        if len(length_symbols) != len(x0_symbols) and not (starts_at_zero):
             raise RuntimeError(
                 "The number of symbols set for the length and initial "
                 + "beam coordinate is distinct. Only one symbol is allowed for the "
@@ -68,35 +95,51 @@ class beam:
             )
 
         # Make sure the initial position and length use the same symbol.
-        if len(self.length.free_symbols) == 1 and not (starts_at_zero):
-            if next(iter(self.length.free_symbols)) != next(iter(self.x0.free_symbols)):
+        if len(length_symbols) == 1 and not (starts_at_zero):
+            if next(iter(length_symbols)) != next(iter(x0_symbols)):
                 raise RuntimeError(
                     "The length and initial coordinate of the beam have "
                     + "been defined with distinct symbols."
                 )
 
-        if len(self.length.free_symbols) > 1:
+        if len(length_symbols) > 1:
             raise RuntimeError(
                 "Only one symbols is allowed to define the length of" + " the beam."
             )
 
         # Store the length symbol
-        if len(self.length.free_symbols) == 1:
-            self.length_symbol = next(iter(self.length.free_symbols))
+        if len(length_symbols) == 1:
+            self.length_symbol = next(iter(length_symbols))
+        else:
+            self.length_symbol = None
+
+        # Ending coordinate of the beam.
+        self._x_end = self.x0 + self.length
+
+        # Numeric length, initial and ending coordinates of the beam, with the length symbol
+        # set to 1, for comparisons between coordinates.
+        self._length_numeric = _numeric(self.length, self.length_symbol)
+        self._x0_numeric = _numeric(self.x0, self.length_symbol)
+        self._x_end_numeric = self._x0_numeric + self._length_numeric
 
         # Initialise the list storing all the input information for the beam
         self.support_list = []
+        # Numeric coordinates of the supports, which are kept sorted.
+        self._support_x_numeric = []
         self.distributed_load_list = []
         self.point_load_list = []
         self.point_moment_list = []
-        self.young_segment_list = [_property_segment(self.x0, self.x0 + self.length, E)]
-        self.young_default = True
-        self.inertia_segment_list = [_property_segment(self.x0, self.x0 + self.length, I)]
-        self.inertia_default = True
+        self.young_segment_list = []
+        self.inertia_segment_list = []
 
         # Initialise the processed beam information.
+        self.young_segments = []
+        self.inertia_segments = []
+        self._young_bounds = np.empty((0, 2))
+        self._inertia_bounds = np.empty((0, 2))
         self.segments = []
         self.points = []
+        self.deflection_solved = False
 
     # -------------------------------------------------------------------------- add_support
     def add_support(self, x_coord, support_type):
@@ -110,7 +153,7 @@ class beam:
           Type of support
         """
         # First check if the coordinate inside the beam.
-        self._check_inside_beam(x_coord)
+        x_coord_numeric = self._check_inside_beam(x_coord)
 
         # Now allocate the correct point type (polymorphism).
         if support_type.lower() == "pin":
@@ -128,14 +171,18 @@ class beam:
         else:
             raise RuntimeError("Unknown support type: {0}.".format(type))
 
-        # If no point exists at that location, create a new one in the beam.
-        for point in self.support_list:
-            if point.x_coord == new_point.x_coord:
-                raise RuntimeError(
-                    "Repeated support for x = {0}.".format(new_point.x_coord)
-                )
+        # If no point exists at that location, create a new one in the beam. The supports
+        # are kept sorted by their numeric coordinate, such that the repeated coordinates
+        # are found by binary search.
+        i = bisect.bisect_left(self._support_x_numeric, x_coord_numeric - tol)
+        if (
+            i < len(self._support_x_numeric)
+            and self._support_x_numeric[i] < x_coord_numeric + tol
+        ):
+            raise RuntimeError("Repeated support for x = {0}.".format(new_point.x_coord))
 
-        self.support_list.append(new_point)
+        self._support_x_numeric.insert(i, x_coord_numeric)
+        self.support_list.insert(i, new_point)
 
     # ----------------------------------------------------------------- add_distributed_load
     def add_distributed_load(self, x_start, x_end, expression):
@@ -169,6 +216,36 @@ class beam:
         new_load = point_load(x_coord, value)
         self.point_load_list.append(new_load)
 
+    # ----------------------------------------------------------------- add_point_loads_bulk
+    def add_point_loads_bulk(self, x_coords, values):
+        """Appends several new point loads to the list of input point loads at once. The
+        coordinates are checked against the beam domain in a single vectorised test.
+
+        Parameters
+        ----------
+        x_coords : sequence of sympifiable types (int, float, string, SympP symbol, etc)
+          Coordinates of the applied loads
+        values : sequence of sympifiable types (int, float, string, SympP symbol, etc)
+          Load values
+        """
+        if len(x_coords) != len(values):
+            raise RuntimeError(
+                "The number of coordinates and values of the point loads is distinct."
+            )
+
+        x_coords_numeric = np.array(
+            [self._get_numeric_coordinate(ix_coord) for ix_coord in x_coords], dtype=float
+        )
+        if np.any(
+            (x_coords_numeric < self._x0_numeric - tol)
+            | (x_coords_numeric > self._x_end_numeric + tol)
+        ):
+            raise RuntimeError("The specified coordinate lies outside the beam.")
+
+        self.point_load_list.extend(
+            point_load(ix_coord, ivalue) for ix_coord, ivalue in zip(x_coords, values)
+        )
+
     # --------------------------------------------------------------------- add_point_moment
     def add_point_moment(self, x_coord, value):
         """Appends a new point moment to the list of input point moments.
@@ -200,11 +277,7 @@ class beam:
         # First check if the coordinate inside the beam.
         self._check_coordinates(x_start, x_end)
 
-        # If the user specifies the property explicitely, reset the default values
-        if self.young_default:
-            self.young_default = False
-            self.young_segment_list = []
-        new_young = _property_segment(x_start, x_end, value)
+        new_young = _property_segment(x_start, x_end, value, self.length_symbol)
         self.young_segment_list.append(new_young)
 
     # -------------------------------------------------------------------------- set_inertia
@@ -213,64 +286,58 @@ class beam:
         # First check if the coordinate inside the beam.
         self._check_coordinates(x_start, x_end)
 
-        # If the user specifies the property explicitely, reset the default values
-        if self.inertia_default:
-            self.inertia_default = False
-            self.inertia_segment_list = []
-        new_inertia = _property_segment(x_start, x_end, value)
+        new_inertia = _property_segment(x_start, x_end, value, self.length_symbol)
         self.inertia_segment_list.append(new_inertia)
 
+    # --------------------------------------------------------------- set_property_segments
+    def _set_property_segments(self):
+        """Sets the Young modulus and second moment of area segments of the beam. When a
+        property has not been specified by the user, it defaults to the symbols 'E' and
+        'I', respectively, along the entire beam.
+        """
+        self.young_segments = self.young_segment_list
+        if not self.young_segments:
+            self.young_segments = [
+                _property_segment(self.x0, self._x_end, E, self.length_symbol)
+            ]
+
+        self.inertia_segments = self.inertia_segment_list
+        if not self.inertia_segments:
+            self.inertia_segments = [
+                _property_segment(self.x0, self._x_end, I, self.length_symbol)
+            ]
+
     # ---------------------------------------------------------------- check_beam_properties
     def _check_beam_properties(self):
         """Verifies is the beam properties have been consistently set along the entire
         length of the beam.
         """
-        # If the length is given as a variable, substitute by 1 for ease of comparison.
-        if self.length.is_number:
-            length_numeric = self.length
-            x0_numeric = self.x0
-            young_x_start_numeric = [item.x_start for item in self.young_segment_list]
-            young_x_end_numeric = [item.x_end for item in self.young_segment_list]
-            inertia_x_start_numeric = [item.x_start for item in self.inertia_segment_list]
-            inertia_x_end_numeric = [item.x_end for item in self.inertia_segment_list]
-        else:
-            length_numeric = self.length.subs({self.length_symbol: 1.0})
-            x0_numeric = self.x0.subs({self.length_symbol: 1.0})
-            young_x_start_numeric = [
-                item.x_start.subs({self.length_symbol: 1.0})
-                for item in self.young_segment_list
-            ]
-            young_x_end_numeric = [
-                item.x_end.subs({self.length_symbol: 1.0})
-                for item in self.young_segment_list
-            ]
-            inertia_x_start_numeric = [
-                item.x_start.subs({self.length_symbol: 1.0})
-                for item in self.inertia_segment_list
-            ]
-            inertia_x_end_numeric = [
-                item.x_end.subs({self.length_symbol: 1.0})
-                for item in self.inertia_segment_list
-            ]
-
-        length_young = 0.0
-        length_inertia = 0.0
+        # The numeric coordinates have the length variable, if any, substituted by 1 for
+        # ease of comparison.
+        length_numeric = self._length_numeric
+        x0_numeric = self._x0_numeric
+        x_end_numeric = self._x_end_numeric
+        # The bounds are kept for the creation of the beam segments.
+        self._young_bounds = _segment_bounds(self.young_segments)
+        young_x_start_numeric = self._young_bounds[:, 0]
+        young_x_end_numeric = self._young_bounds[:, 1]
+        self._inertia_bounds = _segment_bounds(self.inertia_segments)
+        inertia_x_start_numeric = self._inertia_bounds[:, 0]
+        inertia_x_end_numeric = self._inertia_bounds[:, 1]
 
         # Quick check Young modulus specification (check if the proprty segments sum up
         # to the length of the beam).
-        for i in range(len(self.young_segment_list)):
-            if young_x_start_numeric[i] < x0_numeric:
-                raise RuntimeError(
-                    "Yound modulus specified for segment starting outside " + "the beam."
-                )
-
-            if young_x_end_numeric[i] > length_numeric + x0_numeric:
-                raise RuntimeError(
-                    "Young modulus specified for segment ending outside " + "the beam."
-                )
+        if np.any(young_x_start_numeric < x0_numeric):
+            raise RuntimeError(
+                "Yound modulus specified for segment starting outside " + "the beam."
+            )
 
-            length_young = length_young + young_x_end_numeric[i] - young_x_start_numeric[i]
+        if np.any(young_x_end_numeric > x_end_numeric):
+            raise RuntimeError(
+                "Young modulus specified for segment ending outside " + "the beam."
+            )
 
+        length_young = np.sum(young_x_end_numeric - young_x_start_numeric)
         if abs(length_young - length_numeric) > tol:
             raise RuntimeError(
                 "Inconsistent specification of the Young modulus along "
@@ -278,38 +345,26 @@ class beam:
             )
 
         # Now a more thorough verification (truly check if the segments are overlapping).
-        for i in range(len(self.young_segment_list)):
-            for j in range(len(self.young_segment_list)):
-                if j != i:
-                    is_on_the_right = (
-                        young_x_end_numeric[j] < young_x_start_numeric[i] + tol
-                    )
-                    is_on_the_left = young_x_start_numeric[j] > young_x_end_numeric[i] - tol
-                    if not (is_on_the_left or is_on_the_right):
-                        raise RuntimeError(
-                            "Inconsistent specification of the Young "
-                            + "modulus along the beam. There are either repeated or missing "
-                            + "segments of the beam."
-                        )
+        if _check_overlapping(young_x_start_numeric, young_x_end_numeric):
+            raise RuntimeError(
+                "Inconsistent specification of the Young "
+                + "modulus along the beam. There are either repeated or missing "
+                + "segments of the beam."
+            )
 
         # Quick check second moment of area specification (check if the proprty segments sum
         # up to the length of the beam).
-        for i in range(len(self.inertia_segment_list)):
-            if inertia_x_start_numeric[i] < x0_numeric:
-                raise RuntimeError(
-                    "Moment of inertia specified for segment starting "
-                    + "outside the beam."
-                )
-
-            if inertia_x_end_numeric[i] > length_numeric + x0_numeric:
-                raise RuntimeError(
-                    "Moment of inertia specified for segment ending " + "outside the beam."
-                )
+        if np.any(inertia_x_start_numeric < x0_numeric):
+            raise RuntimeError(
+                "Moment of inertia specified for segment starting " + "outside the beam."
+            )
 
-            length_inertia = (
-                length_inertia + inertia_x_end_numeric[i] - inertia_x_start_numeric[i]
+        if np.any(inertia_x_end_numeric > x_end_numeric):
+            raise RuntimeError(
+                "Moment of inertia specified for segment ending " + "outside the beam."
             )
 
+        length_inertia = np.sum(inertia_x_end_numeric - inertia_x_start_numeric)
         if abs(length_inertia - length_numeric) > tol:
             raise RuntimeError(
                 "Inconsistent specification of the moment of inertia "
@@ -317,21 +372,12 @@ class beam:
             )
 
         # Now a more thorough verification (truly check if the segments are overlapping).
-        for i in range(len(self.inertia_segment_list)):
-            for j in range(len(self.inertia_segment_list)):
-                if j != i:
-                    is_on_the_right = (
-                        inertia_x_end_numeric[j] < inertia_x_start_numeric[i] + tol
-                    )
-                    is_on_the_left = (
-                        inertia_x_start_numeric[j] > inertia_x_end_numeric[i] - tol
-                    )
-                    if not (is_on_the_left or is_on_the_right):
-                        raise RuntimeError(
-                            "Inconsistent specification of the moment of "
-                            + "inertia along the beam. There are either repeated or missing "
-                            + "segments of the beam."
-                        )
+        if _check_overlapping(inertia_x_start_numeric, inertia_x_end_numeric):
+            raise RuntimeError(
+                "Inconsistent specification of the moment of "
+                + "inertia along the beam. There are either repeated or missing "
+                + "segments of the beam."
+            )
 
     # -------------------------------------------------------------------- check_coordinates
     def _check_coordinates(self, x_start, x_end):
@@ -344,35 +390,8 @@ class beam:
         x_end : sympifiable type (int, float, string, SympP symbol, etc)
           Starting coordinate of the distributed load
         """
-        x_start_symbol = sym.sympify(x_start)
-        x_end_symbol = sym.sympify(x_end)
-
-        if len(x_start_symbol.free_symbols) > 1:
-            raise RuntimeError("More than one symbol used for starting coordinate.")
-
-        if len(x_end_symbol.free_symbols) > 1:
-            raise RuntimeError("More than one symbol used for coordinate coordinate.")
-
-        if len(x_start_symbol.free_symbols) == 1:
-            if next(iter(x_start_symbol.free_symbols)) != self.length_symbol:
-                raise RuntimeError(
-                    "Distinct symbols have been used for coordinate along "
-                    + "the the beam and beam length."
-                )
-
-        if len(x_end_symbol.free_symbols) == 1:
-            if next(iter(x_end_symbol.free_symbols)) != self.length_symbol:
-                raise RuntimeError(
-                    "Distinct symbols have been used for coordinate along"
-                    + " the the beam and beam length."
-                )
-
-        if self.length.is_number:
-            x_start_numeric = x_start_symbol
-            x_end_numeric = x_end_symbol
-        else:
-            x_start_numeric = x_start_symbol.subs({self.length_symbol: 1})
-            x_end_numeric = x_end_symbol.subs({self.length_symbol: 1})
+        x_start_numeric = self._get_numeric_coordinate(x_start, "starting coordinate")
+        x_end_numeric = self._get_numeric_coordinate(x_end, "ending coordinate")
 
         if abs(x_start_numeric - x_end_numeric) < tol:
             raise RuntimeError(
@@ -384,6 +403,44 @@ class beam:
                 "The starting coordinate is greater than the ending " + "coordinte."
             )
 
+    # --------------------------------------------------------------- get_numeric_coordinate
+    def _get_numeric_coordinate(self, x_coord, name="coordinate"):
+        """Validates the symbols of a coordinate along the beam and converts it into a
+        float, setting the length symbol to 1.
+
+        Parameters
+        ----------
+        x_coord : sympifiable type (int, float, string, SympP symbol, etc)
+          Coordinate along the beam
+        name : str
+          Name of the coordinate in the error messages
+
+        Returns
+        -------
+        x_coord_numeric : float
+          Numeric coordinate
+        """
+        # Plain numbers do not require any symbolic processing.
+        if isinstance(x_coord, (int, float)):
+            return float(x_coord)
+
+        x_coord_symbol = _sympify(x_coord)
+        if x_coord_symbol.is_Number:
+            return float(x_coord_symbol)
+
+        free_symbols = x_coord_symbol.free_symbols
+
+        if len(free_symbols) > 1:
+            raise RuntimeError("More than one symbol used for {0}.".format(name))
+
+        if len(free_symbols) == 1 and next(iter(free_symbols)) != self.length_symbol:
+            raise RuntimeError(
+                "Distinct symbols have been used for coordinate along "
+                + "the the beam and beam length."
+            )
+
+        return _numeric(x_coord_symbol, self.length_symbol)
+
     # -------------------------------------------------------------------- check_inside_beam
     def _check_inside_beam(self, x_coord):
         """Chekcs if a given coordinate is valid and lies inside the beam domain.
@@ -392,154 +449,106 @@ class beam:
         ----------
         x_coord : sympifiable type (int, float, string, SympP symbol, etc)
           Coordinate of the point
-        """
-        x_coord_symbol = sym.sympify(x_coord)
-
-        if len(x_coord_symbol.free_symbols) > 1:
-            raise RuntimeError("More than one symbol used for coordinate.")
 
-        if len(x_coord_symbol.free_symbols) == 1:
-            if next(iter(x_coord_symbol.free_symbols)) != self.length_symbol:
-                raise RuntimeError(
-                    "Distinct symbols have been used for coordinate along "
-                    + "the the beam and beam length."
-                )
-
-        if self.length.is_number:
-            x_coord_numeric = x_coord_symbol
-            length_numeric = self.length
-            x0_numeric = self.x0
-        else:
-            x_coord_numeric = x_coord_symbol.subs({self.length_symbol: 1})
-            length_numeric = self.length.subs({self.length_symbol: 1.0})
-            x0_numeric = self.x0.subs({self.length_symbol: 1.0})
+        Returns
+        -------
+        x_coord_numeric : float
+          Numeric coordinate of the point
+        """
+        x_coord_numeric = self._get_numeric_coordinate(x_coord)
 
-        if not (x0_numeric - tol <= x_coord_numeric <= x0_numeric + length_numeric + tol):
+        if not (self._x0_numeric - tol <= x_coord_numeric <= self._x_end_numeric + tol):
             raise RuntimeError("The specified coordinate lies outside the beam.")
 
+        return x_coord_numeric
+
     # ------------------------------------------------------------------------- set_segments
     def _set_segments(self):
         """Create the beam segments, such that the properties and loads are piecewise
         continuous within each segments and, therefore, are properly setup for symbolic
         integration.
         """
-        # Start by defining all numeric variables in order to be able sort the segments
-        if self.length.is_number:
-            length_numeric = self.length
-            x0_numeric = self.x0
-            young_x_start_numeric = [item.x_start for item in self.young_segment_list]
-            young_x_end_numeric = [item.x_end for item in self.young_segment_list]
-            inertia_x_start_numeric = [item.x_start for item in self.inertia_segment_list]
-            inertia_x_end_numeric = [item.x_end for item in self.inertia_segment_list]
-            support_x_numeric = [item.x_coord for item in self.support_list]
-            point_load_x_numeric = [item.x_coord for item in self.point_load_list]
-            point_moment_x_numeric = [item.x_coord for item in self.point_moment_list]
-            distributed_x_start_numeric = [
-                item.x_start for item in self.distributed_load_list
-            ]
-            distributed_x_end_numeric = [item.x_end for item in self.distributed_load_list]
-        else:
-            length_numeric = self.length.subs({self.length_symbol: 1.0})
-            x0_numeric = self.x0.subs({self.length_symbol: 1.0})
-            young_x_start_numeric = [
-                item.x_start.subs({self.length_symbol: 1.0})
-                for item in self.young_segment_list
-            ]
-            young_x_end_numeric = [
-                item.x_end.subs({self.length_symbol: 1.0})
-                for item in self.young_segment_list
-            ]
-            inertia_x_start_numeric = [
-                item.x_start.subs({self.length_symbol: 1.0})
-                for item in self.inertia_segment_list
-            ]
-            inertia_x_end_numeric = [
-                item.x_end.subs({self.length_symbol: 1.0})
-                for item in self.inertia_segment_list
-            ]
-            support_x_numeric = [
-                item.x_coord.subs({self.length_symbol: 1.0}) for item in self.support_list
-            ]
-            point_load_x_numeric = [
-                item.x_coord.subs({self.length_symbol: 1.0})
-                for item in self.point_load_list
-            ]
-            point_moment_x_numeric = [
-                item.x_coord.subs({self.length_symbol: 1.0})
-                for item in self.point_moment_list
-            ]
-            distributed_x_start_numeric = [
-                item.x_start.subs({self.length_symbol: 1.0})
-                for item in self.distributed_load_list
-            ]
-            distributed_x_end_numeric = [
-                item.x_end.subs({self.length_symbol: 1.0})
-                for item in self.distributed_load_list
-            ]
+        # Discard the points and segments of previous solutions.
+        self.points = []
+        self.segments = []
 
-        young_x_start_symbol = [item.x_start for item in self.young_segment_list]
-        young_x_end_symbol = [item.x_end for item in self.young_segment_list]
-        inertia_x_start_symbol = [item.x_start for item in self.inertia_segment_list]
-        inertia_x_end_symbol = [item.x_end for item in self.inertia_segment_list]
-        support_x_symbol = [item.x_coord for item in self.support_list]
-        point_load_x_symbol = [item.x_coord for item in self.point_load_list]
-        point_moment_x_symbol = [item.x_coord for item in self.point_moment_list]
-        distributed_x_start_symbol = [item.x_start for item in self.distributed_load_list]
-        distributed_x_end_symbol = [item.x_end for item in self.distributed_load_list]
-
-        # Store all coordinates in a single list, sort by ascending order and remove
-        # possible duplicate entries.
-        all_x_coord_numeric = []
-        all_x_coord_numeric.extend(young_x_start_numeric)
-        all_x_coord_numeric.extend(young_x_end_numeric)
-        all_x_coord_numeric.extend(inertia_x_start_numeric)
-        all_x_coord_numeric.extend(inertia_x_end_numeric)
-        all_x_coord_numeric.extend(support_x_numeric)
-        all_x_coord_numeric.extend(point_load_x_numeric)
-        all_x_coord_numeric.extend(point_moment_x_numeric)
-        all_x_coord_numeric.extend(distributed_x_start_numeric)
-        all_x_coord_numeric.extend(distributed_x_end_numeric)
-
-        all_x_coord_symbol = []
-        all_x_coord_symbol.extend(young_x_start_symbol)
-        all_x_coord_symbol.extend(young_x_end_symbol)
-        all_x_coord_symbol.extend(inertia_x_start_symbol)
-        all_x_coord_symbol.extend(inertia_x_end_symbol)
-        all_x_coord_symbol.extend(support_x_symbol)
-        all_x_coord_symbol.extend(point_load_x_symbol)
-        all_x_coord_symbol.extend(point_moment_x_symbol)
-        all_x_coord_symbol.extend(distributed_x_start_symbol)
-        all_x_coord_symbol.extend(distributed_x_end_symbol)
-
-        all_x_coord_symbol = [
-            item for _, item in sorted(zip(all_x_coord_numeric, all_x_coord_symbol))
-        ]
-        all_x_coord_numeric.sort()
+        # Gather all coordinates in a single list and convert them to numeric values in a
+        # single pass. The bounds of the property segments have been converted when checking
+        # them, while the conversion of the remaining coordinates is memoised.
+        all_x_coord_symbol = list(
+            itertools.chain(
+                (item.x_start for item in self.young_segments),
+                (item.x_end for item in self.young_segments),
+                (item.x_start for item in self.inertia_segments),
+                (item.x_end for item in self.inertia_segments),
+                (item.x_coord for item in self.support_list),
+                (item.x_coord for item in self.point_load_list),
+                (item.x_coord for item in self.point_moment_list),
+                (item.x_start for item in self.distributed_load_list),
+                (item.x_end for item in self.distributed_load_list),
+            )
+        )
+        n_property = 2 * (len(self.young_segments) + len(self.inertia_segments))
+        all_x_coord_numeric = np.concatenate(
+            (
+                self._young_bounds.T.ravel(),
+                self._inertia_bounds.T.ravel(),
+                np.fromiter(
+                    (
+                        _numeric(x, self.length_symbol)
+                        for x in all_x_coord_symbol[n_property:]
+                    ),
+                    dtype=float,
+                    count=len(all_x_coord_symbol) - n_property,
+                ),
+            )
+        )
 
-        keep_x_coord = [True]
-        for i in range(1, len(all_x_coord_numeric)):
-            if abs(all_x_coord_numeric[i] - all_x_coord_numeric[i - 1]) < tol:
-                keep_x_coord.extend([False])
-            else:
-                keep_x_coord.extend([True])
+        # Recover the numeric coordinates of each kind of entity as views of the list.
+        (
+            young_x_start_numeric,
+            young_x_end_numeric,
+            inertia_x_start_numeric,
+            inertia_x_end_numeric,
+            _,
+            point_load_x_numeric,
+            point_moment_x_numeric,
+            distributed_x_start_array,
+            distributed_x_end_array,
+        ) = np.split(
+            all_x_coord_numeric,
+            np.cumsum(
+                [
+                    len(self.young_segments),
+                    len(self.young_segments),
+                    len(self.inertia_segments),
+                    len(self.inertia_segments),
+                    len(self.support_list),
+                    len(self.point_load_list),
+                    len(self.point_moment_list),
+                    len(self.distributed_load_list),
+                ]
+            ),
+        )
 
-        beam_x_coord = [
-            all_x_coord_symbol[i]
-            for i in range(len(all_x_coord_numeric))
-            if keep_x_coord[i]
-        ]
-        beam_x_coord_numeric = [
-            all_x_coord_numeric[i]
-            for i in range(len(all_x_coord_numeric))
-            if keep_x_coord[i]
-        ]
-        if abs(beam_x_coord_numeric[0] - x0_numeric) > tol:
+        # Sort by ascending order and remove possible duplicate entries.
+        order = np.argsort(all_x_coord_numeric, kind="stable")
+        all_x_coord_numeric = all_x_coord_numeric[order]
+
+        # Keep the coordinates distinct from the previous one.
+        keep_x_coord = np.empty(len(all_x_coord_numeric), dtype=bool)
+        keep_x_coord[0] = True
+        keep_x_coord[1:] = np.diff(all_x_coord_numeric) >= tol
+
+        beam_x_coord = [all_x_coord_symbol[i] for i in order[keep_x_coord]]
+        beam_x_coord_numeric = all_x_coord_numeric[keep_x_coord]
+        if abs(beam_x_coord_numeric[0] - self._x0_numeric) > tol:
             raise RuntimeError(
                 "Error in segment creation: the first x-coordinate does "
                 + "not match the initial beam coordinate."
             )
 
-        if abs(beam_x_coord_numeric[-1] - x0_numeric - length_numeric) > tol:
+        if abs(beam_x_coord_numeric[-1] - self._x_end_numeric) > tol:
             raise RuntimeError(
                 "Error in segment creation: the last x-coordinate is not "
                 + "consistent with the length of the beam."
@@ -548,14 +557,16 @@ class beam:
         # Create the list of points of the beam
         # -------------------------------------
         for i in range(len(beam_x_coord)):
-            # First, check if the point is a support.
+            # First, check if the point is a support, searching the sorted supports.
             is_support = False
             support = None
-            for j, sup in enumerate(self.support_list):
-                if abs(support_x_numeric[j] - beam_x_coord_numeric[i]) < tol:
-                    is_support = True
-                    support = sup
-                    break
+            j = bisect.bisect_left(self._support_x_numeric, beam_x_coord_numeric[i] - tol)
+            if (
+                j < len(self._support_x_numeric)
+                and self._support_x_numeric[j] < beam_x_coord_numeric[i] + tol
+            ):
+                is_support = True
+                support = self.support_list[j]
 
             # If the point is a support, create a new instance, otherwise, set it as a
             # continuity point.
@@ -564,10 +575,8 @@ class beam:
             else:
                 this_point = continuity(beam_x_coord[i])
 
-            if self.length.is_number:
-                this_x_numeric = this_point.x_coord
-            else:
-                this_x_numeric = this_point.x_coord.subs({self.length_symbol: 1.0})
+            # The numeric coordinate of the point is already known.
+            this_x_numeric = beam_x_coord_numeric[i]
 
             # Second, go add all external point loads and moments.
             for j, load in enumerate(self.point_load_list):
@@ -582,57 +591,54 @@ class beam:
 
         # Create the list of segments of the beam
         # ---------------------------------------
+        # Sort the property segments once, such that each beam segment finds its properties
+        # by binary search.
+        young_order = np.argsort(young_x_start_numeric, kind="stable")
+        inertia_order = np.argsort(inertia_x_start_numeric, kind="stable")
         for i in range(len(self.points) - 1):
             x_start = self.points[i].x_coord
             x_end = self.points[i + 1].x_coord
 
-            if self.length.is_number:
-                x_start_numeric = x_start
-                x_end_numeric = x_end
-            else:
-                x_start_numeric = x_start.subs({self.length_symbol: 1.0})
-                x_end_numeric = x_end.subs({self.length_symbol: 1.0})
+            x_start_numeric = beam_x_coord_numeric[i]
+            x_end_numeric = beam_x_coord_numeric[i + 1]
 
             # First, find the correct Young modulus segment.
-            found_segment = False
-            for j in range(len(self.young_segment_list)):
-                lower_bound = x_start_numeric > young_x_start_numeric[j] - tol
-                upper_bound = x_end_numeric < young_x_end_numeric[j] + tol
-
-                if lower_bound and upper_bound:
-                    found_segment = True
-                    break
-
-            if not (found_segment):
+            j = _find_segment(
+                young_x_start_numeric,
+                young_x_end_numeric,
+                young_order,
+                x_start_numeric,
+                x_end_numeric,
+            )
+            if j < 0:
                 raise RuntimeError("Search for valid Young modulus segment failed.")
 
-            young = self.young_segment_list[j].value
+            young = self.young_segments[j].value
 
             # Second, find the correct inertia segment.
-            found_segment = False
-            for j in range(len(self.inertia_segment_list)):
-                lower_bound = x_start_numeric > inertia_x_start_numeric[j] - tol
-                upper_bound = x_end_numeric < inertia_x_end_numeric[j] + tol
-
-                if lower_bound and upper_bound:
-                    found_segment = True
-                    break
-
-            if not (found_segment):
+            j = _find_segment(
+                inertia_x_start_numeric,
+                inertia_x_end_numeric,
+                inertia_order,
+                x_start_numeric,
+                x_end_numeric,
+            )
+            if j < 0:
                 raise RuntimeError("Search for valid moment of ienrtia segment failed.")
 
-            inertia = self.inertia_segment_list[j].value
-
-            # Lastly, find the expression of the resultant distributed load.
-            q_load_expression = sym.sympify(0)
-            for j in range(len(self.distributed_load_list)):
-                lower_bound = x_start_numeric > distributed_x_start_numeric[j] - tol
-                upper_bound = x_end_numeric < distributed_x_end_numeric[j] + tol
+            inertia = self.inertia_segments[j].value
 
-                if lower_bound and upper_bound:
-                    q_load_expression = (
-                        q_load_expression + self.distributed_load_list[j].expression
-                    )
+            # Lastly, find the expression of the resultant distributed load, summing all
+            # the distributed loads applied on the segment at once.
+            is_applied = (x_start_numeric > distributed_x_start_array - tol) & (
+                x_end_numeric < distributed_x_end_array + tol
+            )
+            q_load_expression = sym.Add(
+                *[
+                    self.distributed_load_list[j].expression
+                    for j in np.flatnonzero(is_applied)
+                ]
+            )
 
             q_load = distributed_load(x_start, x_end, q_load_expression)
 
@@ -687,7 +693,7 @@ class beam:
                 reaction_moment_points.append(i)
 
         # Equilibirum of forces in the y-direction.
-        sum_forces_y = sym.sympify(0)
+        sum_forces_y = sym.S.Zero
 
         for ipoint in self.points:
             sum_forces_y = sum_forces_y + ipoint.external_force + ipoint.reaction_force
@@ -696,7 +702,7 @@ class beam:
             sum_forces_y = sum_forces_y + isegment.distributed_load.equivalent_force
 
         # Equilibirum of moments in the z-direction on the initial point.
-        sum_moments_z = sym.sympify(0)
+        sum_moments_z = sym.S.Zero
 
         for ipoint in self.points:
             sum_moments_z = sum_moments_z + ipoint.reaction_moment
@@ -715,27 +721,25 @@ class beam:
         equilibirum_equations = [sum_forces_y, sum_moments_z]
 
         # Added more moment equilibirum equation at the hinges.
-        for i, ipoint in enumerate(self.points):
-            sum_moments_z_hinge = sym.sympify(0)
-            if isinstance(ipoint, hinge):
-                for jpoint in self.points[i + 1 :]:
-                    sum_moments_z_hinge = sum_moments_z_hinge + jpoint.reaction_moment
-                    sum_moments_z_hinge = sum_moments_z_hinge + jpoint.reaction_force * (
-                        jpoint.x_coord - ipoint.x_coord
-                    )
-                    sum_moments_z_hinge = sum_moments_z_hinge + jpoint.external_moment
-                    sum_moments_z_hinge = sum_moments_z_hinge + jpoint.external_force * (
-                        jpoint.x_coord - ipoint.x_coord
-                    )
-
-                for jsegment in self.segments[i:]:
-                    sum_moments_z_hinge = (
-                        sum_moments_z_hinge
-                        + jsegment.distributed_load.equivalent_moment
-                        - jsegment.distributed_load.equivalent_force * ipoint.x_coord
-                    )
-
-                equilibirum_equations.extend([sum_moments_z_hinge])
+        hinge_indices = [
+            i for i, ipoint in enumerate(self.points) if isinstance(ipoint, hinge)
+        ]
+        for i in hinge_indices:
+            ipoint = self.points[i]
+            terms = []
+            for jpoint in self.points[i + 1 :]:
+                terms.append(jpoint.reaction_moment)
+                terms.append(jpoint.reaction_force * (jpoint.x_coord - ipoint.x_coord))
+                terms.append(jpoint.external_moment)
+                terms.append(jpoint.external_force * (jpoint.x_coord - ipoint.x_coord))
+
+            for jsegment in self.segments[i:]:
+                terms.append(jsegment.distributed_load.equivalent_moment)
+                terms.append(-jsegment.distributed_load.equivalent_force * ipoint.x_coord)
+
+            # Build the sum at once, keeping the resulting Add flat.
+            sum_moments_z_hinge = sym.Add(*terms)
+            equilibirum_equations.append(sum_moments_z_hinge)
 
         # Solve the system of equations.
         if len(equilibirum_equations) != len(unknown_reactions):
@@ -772,47 +776,39 @@ class beam:
         )
 
         # Loop over the segments are find the shear force and bending moment distribution.
-        for i in range(len(self.segments)):
+        # The integration constants follow directly from the continuity with the left
+        # boundary, as they enter the expressions linearly.
+        for isegment, ipoint in zip(self.segments, self.points[1:]):
             # Shear force.
             # ------------
-            C = sym.symbols("C")
-            self.segments[i].shear_force = sym.integrate(
-                -self.segments[i].distributed_load.expression, x
-            )
-            sol = sym.solve(
-                self.segments[i].shear_force.subs({x: self.segments[i].x_start})
-                + C
-                - shear_force_left,
-                (C),
-            )
-            C = sol[0]
-            self.segments[i].shear_force = self.segments[i].shear_force + C
+            # Unloaded segments, the most common case, have a constant shear force.
+            if isegment.distributed_load.expression == sym.S.Zero:
+                isegment.shear_force = shear_force_left
+            else:
+                shear_force = _integrate(-isegment.distributed_load.expression)
+                isegment.shear_force = (
+                    shear_force + shear_force_left - shear_force.subs({x: isegment.x_start})
+                )
 
             # Bending moment
             # --------------
-            C = sym.symbols("C")
-            self.segments[i].bending_moment = sym.integrate(
-                -self.segments[i].shear_force, x
+            bending_moment = _integrate(-isegment.shear_force)
+            isegment.bending_moment = (
+                bending_moment
+                + bending_moment_left
+                - bending_moment.subs({x: isegment.x_start})
             )
-            sol = sym.solve(
-                self.segments[i].bending_moment.subs({x: self.segments[i].x_start})
-                + C
-                - bending_moment_left,
-                (C),
-            )
-            C = sol[0]
-            self.segments[i].bending_moment = self.segments[i].bending_moment + C
 
             # Update the boundary condition for the next segment.
             shear_force_left = (
-                self.segments[i].shear_force.subs({x: self.segments[i].x_end})
-                - self.points[i + 1].external_force
-                - self.points[i + 1].reaction_force
+                isegment.shear_force.subs({x: isegment.x_end})
+                - ipoint.external_force
+                - ipoint.reaction_force
             )
             bending_moment_left = (
-                self.segments[i].bending_moment.subs({x: self.segments[i].x_end})
-                - self.points[i + 1].external_moment
-                - self.points[i + 1].reaction_moment
+                isegment.bending_moment.subs({x: isegment.x_end})
+                - ipoint.external_moment
+                - ipoint.reaction_moment
             )
 
     # --------------------------------------------------------------------- solve_deflection
@@ -824,58 +820,77 @@ class beam:
         # Compute the deflection expression at each segment of the beam in terms of the
         # integration coefficients.
         for i in range(len(self.segments)):
-            rotation_integration_constant = sym.symbols("S{0}".format(i))
-            deflection_integration_constant = sym.symbols("D{0}".format(i))
+            (
+                rotation_integration_constant,
+                deflection_integration_constant,
+            ) = _integration_constants(i)
             unknowns_deflection.append(rotation_integration_constant)
             unknowns_deflection.append(deflection_integration_constant)
-            self.segments[i].rotation = (
-                sym.integrate(
-                    self.segments[i].bending_moment
-                    / (self.segments[i].young * self.segments[i].inertia),
-                    x,
-                )
-                + rotation_integration_constant
+            # The integration constants are kept out of the integrands, such that equal
+            # integrands (e.g., for repeated solutions) are integrated only once.
+            rotation = _integrate(
+                self.segments[i].bending_moment / self.segments[i].flexural_rigidity
             )
+            self.segments[i].rotation = rotation + rotation_integration_constant
             self.segments[i].deflection = (
-                sym.integrate(self.segments[i].rotation, x)
+                _integrate(rotation)
+                + rotation_integration_constant * x
                 + deflection_integration_constant
             )
 
         # Set up the system of equations with the geometri boundary conditions of the
         # beam and determine the integration coefficients.
         geometry_equations = []
-        self.points[0].set_geometric_boundary_conditions(
-            [self.segments[0].rotation], [self.segments[0].deflection], geometry_equations
-        )
-
-        for i, point in enumerate(self.points[1:-1]):
-            self.points[i + 1].set_geometric_boundary_conditions(
-                [self.segments[i].rotation, self.segments[i + 1].rotation],
-                [self.segments[i].deflection, self.segments[i + 1].deflection],
-                geometry_equations,
+        for i, ipoint in enumerate(self.points):
+            # Segments adjacent to the point: only one at the ends of the beam.
+            adjacent_segments = self.segments[max(i - 1, 0) : i + 1]
+            geometry_equations.extend(
+                ipoint.get_geometric_boundary_conditions(
+                    [isegment.rotation for isegment in adjacent_segments],
+                    [isegment.deflection for isegment in adjacent_segments],
+                )
             )
 
-        self.points[-1].set_geometric_boundary_conditions(
-            [self.segments[-1].rotation], [self.segments[-1].deflection], geometry_equations
-        )
+        # The boundary conditions are linear in the integration constants, hence, the
+        # system is solved directly by Gaussian elimination. As done by sym.solve, floats
+        # are converted to rationals before solving and back afterwards, to avoid round-off
+        # errors in the solution.
+        has_floats = any(iequation.has(sym.Float) for iequation in geometry_equations)
+        if has_floats:
+            geometry_equations = [
+                sym.nsimplify(iequation, rational=True) for iequation in geometry_equations
+            ]
+        matrix, rhs = sym.linear_eq_to_matrix(geometry_equations, unknowns_deflection)
+        (sol_values,) = sym.linsolve((matrix, rhs), unknowns_deflection)
+        if has_floats:
+            sol_values = [sym.nfloat(ivalue, exponent=False) for ivalue in sol_values]
+        sol = dict(zip(unknowns_deflection, sol_values))
+        # The keys of the solution are the integration constants themselves, hence, a
+        # structural replacement is enough.
+        for isegment in self.segments:
+            isegment.rotation = isegment.rotation.xreplace(sol)
+            isegment.deflection = isegment.deflection.xreplace(sol)
 
-        sol = sym.solve(geometry_equations, unknowns_deflection, dict=True)
-        for i in range(len(self.segments)):
-            self.segments[i].rotation = self.segments[i].rotation.subs(
-                {unknowns_deflection[2 * i]: sol[0][unknowns_deflection[2 * i]]}
-            )
-            self.segments[i].deflection = self.segments[i].deflection.subs(
-                {unknowns_deflection[2 * i]: sol[0][unknowns_deflection[2 * i]]}
-            )
-            self.segments[i].deflection = self.segments[i].deflection.subs(
-                {unknowns_deflection[2 * i + 1]: sol[0][unknowns_deflection[2 * i + 1]]}
-            )
+        self.deflection_solved = True
 
     # -------------------------------------------------------------------------------- solve
-    def solve(self, output=True):
+    def solve(self, output=True, deflection=True):
         """Solves the beam equilibirum problem, determining the reactions, diagrams of
         internal loads and deflections.
+
+        Parameters
+        ----------
+        output : bool
+          Whether to print the results
+        deflection : bool
+          Whether to solve for the deflections. When skipped, the deflections are only
+          solved if the beam is plotted
         """
+        # Discard the printed expressions of previous solutions.
+        _sstr.cache_clear()
+        self._trim_trailing_zeros.cache_clear()
+        # Set the properties along the beam, using the default ones where not specified.
+        self._set_property_segments()
         # Checfk if the properties have been properly set.
         self._check_beam_properties()
         # Set the beam segments with piecewise continuous properties.
@@ -885,7 +900,9 @@ class beam:
         # Solver for internal loads.
         self._solve_internal_loads()
         # Solve for deflection.
-        self._solve_deflection()
+        self.deflection_solved = False
+        if deflection:
+            self._solve_deflection()
 
         # Output the results.
         if output:
@@ -893,10 +910,11 @@ class beam:
             self._print_segments()
             self._print_reactions()
             self._print_internal_loads()
-            self._print_deflections()
+            if deflection:
+                self._print_deflections()
 
     # --------------------------------------------------------------------------------- plot
-    def plot(self, subs={}):
+    def plot(self, subs=None):
         """Plots the shear force and bending moment diagrams and the deflection.
 
         Parameters
@@ -926,8 +944,15 @@ class beam:
         xmin = 0
         xmax = 0
 
-        # Remove the 'x' variable from the user substitutions
-        subs.pop("x", None)
+        # Remove the 'x' variable from the user substitutions, without modifying them.
+        if subs is None:
+            subs = {}
+        else:
+            subs = {key: value for key, value in subs.items() if key != "x"}
+
+        # Solve for the deflections if skipped when solving the beam.
+        if self.segments and not self.deflection_solved:
+            self._solve_deflection()
 
         # Create the figure and plot the shear force, bending moment and deflection for
         # each segment.
@@ -947,65 +972,21 @@ class beam:
 
         # Plots segments
         # --------------
+        # Keep track of the files registered in the line cache before lambdifying.
+        cached_files = set(linecache.cache)
         for i, isegment in enumerate(self.segments):
-            # Copies of the relevant expressions
-            distributed_load_plot = isegment.distributed_load.expression
-            shear_force_plot = isegment.shear_force
-            bending_moment_plot = isegment.bending_moment
-            deflection_plot = isegment.deflection
-            x_start_plot = isegment.x_start
-            x_end_plot = isegment.x_end
-
-            # User defined substitutions
-            distributed_load_plot = distributed_load_plot.subs(subs)
-            shear_force_plot = shear_force_plot.subs(subs)
-            bending_moment_plot = bending_moment_plot.subs(subs)
-            deflection_plot = deflection_plot.subs(subs)
-            x_start_plot = x_start_plot.subs(subs)
-            x_end_plot = x_end_plot.subs(subs)
-
-            # Create new expressions by substituting all remaining symbolic variables with
-            # '1', except for the x variable
-            variables_distributed_load = distributed_load_plot.free_symbols
-            variables_distributed_load.discard(x)
-            variables_shear_force = shear_force_plot.free_symbols
-            variables_shear_force.discard(x)
-            variables_bending_moment = bending_moment_plot.free_symbols
-            variables_bending_moment.discard(x)
-            variables_deflection = deflection_plot.free_symbols
-            variables_deflection.discard(x)
-            variables_x_start = x_start_plot.free_symbols
-            variables_x_start.discard(x)
-            variables_x_end = x_end_plot.free_symbols
-            variables_x_end.discard(x)
-
-            for ivariable in variables_distributed_load:
-                distributed_load_plot = distributed_load_plot.subs({ivariable: 1})
-
-            for ivariable in variables_shear_force:
-                shear_force_plot = shear_force_plot.subs({ivariable: 1})
-
-            for ivariable in variables_bending_moment:
-                bending_moment_plot = bending_moment_plot.subs({ivariable: 1})
-
-            for ivariable in variables_deflection:
-                deflection_plot = deflection_plot.subs({ivariable: 1})
-
-            for ivariable in variables_x_start:
-                x_start_plot = x_start_plot.subs({ivariable: 1})
-
-            for ivariable in variables_x_end:
-                x_end_plot = x_end_plot.subs({ivariable: 1})
-
-            # Numeric plotting x variable.
-            x_plot = np.linspace(
-                float(x_start_plot), float(x_end_plot), num=100, endpoint=True
-            )
+            # Numeric values of the diagrams along the segment.
+            (
+                x_plot,
+                (
+                    distributed_load_numeric,
+                    shear_force_numeric,
+                    bending_moment_numeric,
+                    deflection_numeric,
+                ),
+            ) = _evaluate_segment(isegment, subs)
 
             # Distributed load plot.
-            distributed_load_numeric = np.vectorize(sym.lambdify(x, distributed_load_plot))(
-                x_plot
-            )
             max_distributed_load.append(np.max(np.abs(distributed_load_numeric)))
             ax[0].plot(
                 x_plot,
@@ -1027,13 +1008,13 @@ class beam:
             # Shear force plot.
             ax[1].plot(
                 x_plot,
-                np.vectorize(sym.lambdify(x, shear_force_plot))(x_plot),
+                shear_force_numeric,
                 color=color_shear_force,
                 linewidth=line_width_diagrams,
             )
             ax[1].fill_between(
                 x_plot,
-                sym.lambdify(x, shear_force_plot)(x_plot),
+                shear_force_numeric,
                 color=color_shear_force,
                 alpha=alpha,
             )
@@ -1041,13 +1022,13 @@ class beam:
             # Bending diagram plot.
             ax[2].plot(
                 x_plot,
-                np.vectorize(sym.lambdify(x, bending_moment_plot))(x_plot),
+                bending_moment_numeric,
                 color=color_bending_moment,
                 linewidth=line_width_diagrams,
             )
             ax[2].fill_between(
                 x_plot,
-                sym.lambdify(x, bending_moment_plot)(x_plot),
+                bending_moment_numeric,
                 color=color_bending_moment,
                 alpha=alpha,
             )
@@ -1055,7 +1036,7 @@ class beam:
             # Deflection plot.
             ax[3].plot(
                 x_plot,
-                np.vectorize(sym.lambdify(x, deflection_plot))(x_plot),
+                deflection_numeric,
                 color=color_deflection,
                 linewidth=line_width_deflection,
             )
@@ -1073,6 +1054,12 @@ class beam:
             if i == len(self.segments) - 1:
                 xmax = x_plot[-1]
 
+        # SymPy stores the source code of every lambdified function in the line cache,
+        # which would otherwise grow with each call.
+        for filename in set(linecache.cache) - cached_files:
+            if filename.startswith("<lambdifygenerated-"):
+                del linecache.cache[filename]
+
         # Set the y-axis upper and lower bounds for the beam representation.
         ymax = max(max_distributed_load) * 1.1
         if ymax < tol:
@@ -1087,12 +1074,14 @@ class beam:
 
         # Plot points
         # -----------
+        # The limits of the axis are fixed, hence, they are gathered once for all points.
+        context = get_plot_context(ax[0])
         external_force_plot_vector = np.zeros((len(self.points)))
         external_moment_plot_vector = np.zeros((len(self.points)))
-        # Loop over the points, draw the points and extract the magnitudes of the external
-        # forces and moments.
+        # Draw all points at once, then loop over the points and extract the magnitudes of
+        # the external forces and moments.
+        draw_points(self.points, ax[0], input_substitution=subs, context=context)
         for i, ipoint in enumerate(self.points):
-            ipoint.draw_support(ax[0], input_substitution=subs)
             external_force_plot = ipoint.external_force
             external_moment_plot = ipoint.external_moment
 
@@ -1125,11 +1114,17 @@ class beam:
         for i, ipoint in enumerate(self.points):
             if abs(external_force_plot_vector[i]) > tol:
                 ipoint.draw_force(
-                    ax[0], external_force_plot_vector[i], input_substitution=subs
+                    ax[0],
+                    external_force_plot_vector[i],
+                    input_substitution=subs,
+                    context=context,
                 )
             if abs(external_moment_plot_vector[i]) > tol:
                 ipoint.draw_moment(
-                    ax[0], external_moment_plot_vector[i], input_substitution=subs
+                    ax[0],
+                    external_moment_plot_vector[i],
+                    input_substitution=subs,
+                    context=context,
                 )
 
         # Axis labels.
@@ -1155,133 +1150,150 @@ class beam:
 
         return fig, ax
 
+    # ---------------------------------------------------------------------- compile_numeric
+    def compile_numeric(self, subs=None):
+        """Converts the solution of the beam into numeric functions, one per segment.
+
+        Parameters
+        ----------
+        subs : dictionary
+          User-specified symbols substitution for the symbolic expressions. All symbols
+          other than x must be substituted
+
+        Returns
+        -------
+        functions : list of callables
+          Functions evaluating the distributed load, shear force, bending moment, rotation
+          and deflection of each segment over a NumPy array of coordinates, one per row
+        """
+        if not self.segments:
+            raise RuntimeError("The beam must be solved before compiling its solution.")
+
+        # Solve for the deflections if skipped when solving the beam.
+        if not self.deflection_solved:
+            self._solve_deflection()
+
+        if subs is None:
+            subs = {}
+
+        functions = []
+        for isegment in self.segments:
+            diagrams = [
+                isegment.distributed_load.expression.subs(subs),
+                isegment.shear_force.subs(subs),
+                isegment.bending_moment.subs(subs),
+                isegment.rotation.subs(subs),
+                isegment.deflection.subs(subs),
+            ]
+            variables = set().union(*(idiagram.free_symbols for idiagram in diagrams))
+            variables.discard(x)
+            if variables:
+                raise RuntimeError(
+                    "The symbols {0} must be substituted to compile the solution.".format(
+                        sorted(variables, key=str)
+                    )
+                )
+
+            functions.append(_compile_diagrams(diagrams))
+
+        return functions
+
     # ------------------------------------------------------------------------- print_points
     def _print_points(self):
         """Prints the information of points identified along the beam."""
-        print("\n{0:^83}".format("Beam points"))
-        print(83 * "=")
-        print(
-            "{0:^20} {1:^20} {2:^20} {3:^20}".format("Coordinate", "Type", "Load", "Moment")
-        )
-        print(83 * "-")
+        lines = _table_header("Beam points", _ROW_4("Coordinate", "Type", "Load", "Moment"))
         for ipoint in self.points:
             x_coord_str = self._trim_trailing_zeros(ipoint.x_coord)
-            print(
-                "{0:^20} {1:^20} {2:^20} {3:^20}".format(
+            lines.append(
+                _ROW_4(
                     x_coord_str,
                     ipoint.get_name(),
-                    str(ipoint.external_force),
-                    str(ipoint.external_moment),
+                    _sstr(ipoint.external_force),
+                    _sstr(ipoint.external_moment),
                 )
             )
 
-        print(83 * "=" + "\n")
+        _write_table(lines)
 
     # ----------------------------------------------------------------------- print_segments
     def _print_segments(self):
         """Prints the information of the identified segments."""
-        print("\n{0:^83}".format("Beam segments"))
-        print(83 * "=")
-        print(
-            "{0:^20} {1:^20} {2:^20} {3:^20}".format(
-                "Span", "Young modulus", "Inertia", "Distributed load"
-            )
+        lines = _table_header(
+            "Beam segments", _ROW_4("Span", "Young modulus", "Inertia", "Distributed load")
         )
-        print(83 * "-")
         for isegment in self.segments:
             # Trim decimal places when numeric
             x_start_str = self._trim_trailing_zeros(isegment.x_start)
             x_end_str = self._trim_trailing_zeros(isegment.x_end)
-            span_string = "[ {0:^5} - {1:^5} ]".format(x_start_str, x_end_str)
-            print(
-                "{0:^20} {1:^20} {2:^20} {3:^20}".format(
-                    span_string,
-                    str(isegment.young),
-                    str(isegment.inertia),
-                    str(isegment.distributed_load.expression),
+            lines.append(
+                _ROW_4(
+                    _SPAN(x_start_str, x_end_str),
+                    _sstr(isegment.young),
+                    _sstr(isegment.inertia),
+                    _sstr(isegment.distributed_load.expression),
                 )
             )
 
-        print(83 * "=" + "\n")
+        _write_table(lines)
 
     # ---------------------------------------------------------------------- print_reactions
     def _print_reactions(self):
         """Prints the reactions forces."""
-        print("\n{0:^83}".format("Exterior Reactions"))
-        print(83 * "=")
-        print("{0:^27} {1:^27} {2:^27}".format("Point", "Type", "Value"))
-        print(83 * "-")
+        lines = _table_header("Exterior Reactions", _ROW_3("Point", "Type", "Value"))
         for ipoint in self.points:
+            x_coord_str = self._trim_trailing_zeros(ipoint.x_coord)
             if ipoint.has_reaction_force():
-                x_coord_str = self._trim_trailing_zeros(ipoint.x_coord)
-                print(
-                    "{0:^27} {1:^27} {2:^27}".format(
-                        x_coord_str, "Force", str(ipoint.reaction_force)
-                    )
-                )
+                lines.append(_ROW_3(x_coord_str, "Force", _sstr(ipoint.reaction_force)))
 
             if ipoint.has_reaction_moment():
-                x_coord_str = self._trim_trailing_zeros(ipoint.x_coord)
-                print(
-                    "{0:^27} {1:^27} {2:^27}".format(
-                        x_coord_str, "Moment", str(ipoint.reaction_moment)
-                    )
-                )
+                lines.append(_ROW_3(x_coord_str, "Moment", _sstr(ipoint.reaction_moment)))
 
-        print(83 * "=" + "\n")
+        _write_table(lines)
 
     # ----------------------------------------------------------------- print_internal_loads
     def _print_internal_loads(self):
         """Prints the shear force and bending moment expression for each segment."""
-        print("\n{0:^83}".format("Internal Loads"))
-        print(83 * "=")
-        print("{0:^20} {1:^10} {2:^50}".format("Span", "Diagram", "Expression"))
+        lines = _table_header(
+            "Internal Loads",
+            _ROW_EXPRESSION("Span", "Diagram", "Expression"),
+            separator=False,
+        )
         for isegment in self.segments:
             x_start_str = self._trim_trailing_zeros(isegment.x_start)
             x_end_str = self._trim_trailing_zeros(isegment.x_end)
-            print(83 * "-")
-            span_string = "[ {0:^5} - {1:^5} ]".format(x_start_str, x_end_str)
-            print(
-                "{0:^20} {1:^10} {2:^50}".format(
-                    span_string, "V(x)", str(isegment.shear_force)
-                )
-            )
-            print(
-                "{0:^20} {1:^10} {2:^50}".format(
-                    span_string, "M(x)", str(isegment.bending_moment)
-                )
+            span_string = _SPAN(x_start_str, x_end_str)
+            lines.append(83 * "-")
+            lines.append(_ROW_EXPRESSION(span_string, "V(x)", _sstr(isegment.shear_force)))
+            lines.append(
+                _ROW_EXPRESSION(span_string, "M(x)", _sstr(isegment.bending_moment))
             )
 
-        print(83 * "=" + "\n")
+        _write_table(lines)
 
     # -------------------------------------------------------------------- print_deflections
     def _print_deflections(self):
         """Prints the shear force and bending moment expression for each segment."""
-        print("\n{0:^83}".format("Rotation and deflection"))
-        print(83 * "=")
-        print("{0:^20} {1:^10} {2:^50}".format("Span", "Variable", "Expression"))
+        lines = _table_header(
+            "Rotation and deflection",
+            _ROW_EXPRESSION("Span", "Variable", "Expression"),
+            separator=False,
+        )
         for isegment in self.segments:
             x_start_str = self._trim_trailing_zeros(isegment.x_start)
             x_end_str = self._trim_trailing_zeros(isegment.x_end)
-            print(83 * "-")
-            span_string = "[ {0:^5} - {1:^5} ]".format(x_start_str, x_end_str)
-            print(
-                "{0:^20} {1:^10} {2:^50}".format(
-                    span_string, "v(x)", str(isegment.deflection)
-                )
-            )
-            print(
-                "{0:^20} {1:^10} {2:^50}".format(
-                    span_string, "dv/dx(x)", str(isegment.rotation)
-                )
-            )
+            span_string = _SPAN(x_start_str, x_end_str)
+            lines.append(83 * "-")
+            lines.append(_ROW_EXPRESSION(span_string, "v(x)", _sstr(isegment.deflection)))
+            lines.append(_ROW_EXPRESSION(span_string, "dv/dx(x)", _sstr(isegment.rotation)))
 
-        print(83 * "=" + "\n")
+        _write_table(lines)
 
     # ------------------------------------------------------------------ trim_trailing_zeros
     @staticmethod
+    @functools.lru_cache(maxsize=4096, typed=True)
     def _trim_trailing_zeros(expr):
-        """Removes the trailing zeros from a SymPy expression containing only numbers.
+        """Removes the trailing zeros from a SymPy expression containing only numbers. The
+        results are memoised, as each coordinate is printed in several output tables.
 
         Parameters
         ----------
@@ -1293,7 +1305,7 @@ class beam:
         expr_trimmed : SymPy expression
           Output (trimmed expression)
         """
-        expr_trimmed = str(expr)
+        expr_trimmed = _sstr(expr)
         if len(expr.free_symbols) == 0 and "." in expr_trimmed:
             expr_trimmed = expr_trimmed.rstrip("0")
             if expr_trimmed[-1] == ".":
@@ -1306,28 +1318,388 @@ class beam:
 class _property_segment:
     """Class for segments properties in a symbolic-compatible fashion."""
 
-    def __init__(self, x_start, x_end, value):
-        self.x_start = sym.sympify(x_start)
-        self.x_end = sym.sympify(x_end)
-        self.value = sym.sympify(value)
+    __slots__ = ("x_start", "x_end", "value", "x_start_numeric", "x_end_numeric")
+
+    def __init__(self, x_start, x_end, value, length_symbol=None):
+        self.x_start = _sympify(x_start)
+        self.x_end = _sympify(x_end)
+        self.value = _sympify(value)
+
+        # Numeric coordinates, with the length symbol of the beam set to 1.
+        self.x_start_numeric = _numeric(self.x_start, length_symbol)
+        self.x_end_numeric = _numeric(self.x_end, length_symbol)
 
 
 # ================================================================================== segment
 class _segment:
     """Beam segments with locally continuous properties and loadings."""
 
+    __slots__ = (
+        "x_start",
+        "x_end",
+        "distributed_load",
+        "young",
+        "inertia",
+        "flexural_rigidity",
+        "shear_force",
+        "bending_moment",
+        "rotation",
+        "deflection",
+    )
+
     def __init__(self, x_start, x_end, distributed_load, young, inertia):
-        self.x_start = sym.sympify(x_start)
-        self.x_end = sym.sympify(x_end)
+        self.x_start = _sympify(x_start)
+        self.x_end = _sympify(x_end)
         self.distributed_load = distributed_load
-        self.young = sym.sympify(young)
-        self.inertia = sym.sympify(inertia)
+        self.young = _sympify(young)
+        self.inertia = _sympify(inertia)
+        self.flexural_rigidity = self.young * self.inertia
 
         # Iniitialise the expressions of the bending moment and shear force diagrams.
-        self.shear_force = sym.sympify(0)
-        self.bending_moment = sym.sympify(0)
-        self.rotation = sym.sympify(0)
-        self.deflection = sym.sympify(0)
+        self.shear_force = sym.S.Zero
+        self.bending_moment = sym.S.Zero
+        self.rotation = sym.S.Zero
+        self.deflection = sym.S.Zero
+
+
+# ================================================================================== numeric
+@functools.lru_cache(maxsize=4096, typed=True)
+def _numeric(expr, length_symbol):
+    """Converts a coordinate along the beam into a float, setting the length symbol to 1.
+    The conversion is memoised, as the same coordinates are shared by the supports, loads,
+    points and segments of the beam.
+
+    Parameters
+    ----------
+    expr : SymPy expression
+      Coordinate, either numeric or depending on the length symbol
+    length_symbol : SymPy symbol or None
+      Length symbol of the beam, None if the length is numeric
+
+    Returns
+    -------
+    value : float
+      Numeric coordinate
+    """
+    # Numeric coordinates, such as the origin of the beam, do not depend on the length.
+    if length_symbol is None or expr.is_Number:
+        return float(expr)
+
+    # The key is a plain symbol, hence, a structural replacement is enough.
+    return float(expr.xreplace({length_symbol: sym.S.One}))
+
+
+# ===================================================================================== sstr
+@functools.lru_cache(maxsize=4096, typed=True)
+def _sstr(expr):
+    """Returns the printed form of a SymPy expression, such that expressions shared by
+    several output tables are only printed once.
+
+    Parameters
+    ----------
+    expr : SymPy expression
+      Input expression
+
+    Returns
+    -------
+    expr_str : str
+      Printed expression
+    """
+    return str(expr)
+
+
+# ============================================================================= table_header
+def _table_header(title, header, separator=True):
+    """Returns the first lines of an output table: title, top border and column header.
+
+    Parameters
+    ----------
+    title : str
+      Title of the table
+    header : str
+      Formatted column header
+    separator : bool
+      Whether to close the header with a separator line
+
+    Returns
+    -------
+    lines : list of str
+      Lines of the table header
+    """
+    lines = ["\n{0:^83}".format(title), 83 * "=", header]
+    if separator:
+        lines.append(83 * "-")
+    return lines
+
+
+# ============================================================================== write_table
+def _write_table(lines):
+    """Closes an output table with the bottom border and writes it to the standard output
+    at once.
+
+    Parameters
+    ----------
+    lines : list of str
+      Lines of the table
+    """
+    lines.append(83 * "=" + "\n")
+    sys.stdout.write("\n".join(lines) + "\n")
+
+
+# =========================================================================== segment_bounds
+def _segment_bounds(segments):
+    """Gathers the numeric coordinates of a list of property segments in a single pass.
+
+    Parameters
+    ----------
+    segments : list of _property_segment
+      Property segments
+
+    Returns
+    -------
+    bounds : NumPy array of floats
+      Starting and ending coordinates of the segments, one segment per row
+    """
+    bounds = np.empty((len(segments), 2))
+    for i, isegment in enumerate(segments):
+        bounds[i, 0] = isegment.x_start_numeric
+        bounds[i, 1] = isegment.x_end_numeric
+
+    return bounds
+
+
+# ======================================================================== check_overlapping
+def _check_overlapping(x_start, x_end):
+    """Checks if any pair of intervals overlaps, within the numerical tolerance.
+
+    Parameters
+    ----------
+    x_start : NumPy array of floats
+      Starting coordinates of the intervals
+    x_end : NumPy array of floats
+      Ending coordinates of the intervals
+
+    Returns
+    -------
+    flag : bool
+      True if at least two intervals overlap
+    """
+    # Sweep the intervals sorted by their starting coordinate: an interval overlaps a
+    # previous one if it starts before the furthest end reached so far.
+    order = np.argsort(x_start, kind="stable")
+    furthest_end = np.maximum.accumulate(x_end[order])
+
+    return bool(np.any(x_start[order][1:] <= furthest_end[:-1] - tol))
+
+
+# ============================================================================= find_segment
+def _find_segment(x_start, x_end, order, x_start_segment, x_end_segment):
+    """Finds the interval containing a given segment, within the numerical tolerance. The
+    intervals must not overlap.
+
+    Parameters
+    ----------
+    x_start : NumPy array of floats
+      Starting coordinates of the intervals
+    x_end : NumPy array of floats
+      Ending coordinates of the intervals
+    order : NumPy array of ints
+      Indices sorting the intervals by their starting coordinates
+    x_start_segment : float
+      Starting coordinate of the segment
+    x_end_segment : float
+      Ending coordinate of the segment
+
+    Returns
+    -------
+    index : int
+      Index of the interval containing the segment, -1 if none is found
+    """
+    # Last interval starting before the segment: as the intervals do not overlap, it is
+    # the only one that can contain the segment.
+    k = np.searchsorted(x_start, x_start_segment + tol, side="left", sorter=order) - 1
+    if k < 0:
+        return -1
+
+    j = order[k]
+    if x_end_segment < x_end[j] + tol:
+        return int(j)
+
+    return -1
+
+
+# ==================================================================== integration_constants
+@functools.lru_cache(maxsize=None)
+def _integration_constants(index):
+    """Returns the rotation and deflection integration constants of a segment. The symbols
+    are created once and reused by all subsequent solutions.
+
+    Parameters
+    ----------
+    index : int
+      Index of the segment
+
+    Returns
+    -------
+    constants : tuple of SymPy symbols
+      Rotation and deflection integration constants
+    """
+    return sym.symbols("S{0} D{0}".format(index))
+
+
+# ================================================================================ integrate
+@functools.lru_cache(maxsize=1024)
+def _integrate(expr):
+    """Computes the indefinite integral of an expression with respect to x. The results are
+    cached, as SymPy expressions are immutable and hashable.
+
+    Parameters
+    ----------
+    expr : SymPy expression
+      Integrand
+
+    Returns
+    -------
+    integral : SymPy expression
+      Indefinite integral, without integration constant
+    """
+    return sym.integrate(expr, x)
+
+
+# ========================================================================= evaluate_segment
+def _evaluate_segment(segment, subs):
+    """Evaluates the distributed load, shear force, bending moment and deflection of a
+    segment at the plotting coordinates.
+
+    Parameters
+    ----------
+    segment : _segment
+      Solved beam segment
+    subs : dictionary
+      User-specified symbols substitution for the symbolic expressions. The remaining
+      symbols, other than x, are replaced by 1
+
+    Returns
+    -------
+    x_plot : NumPy array
+      Plotting coordinates along the segment
+    values_numeric : NumPy array
+      Distributed load, shear force, bending moment and deflection at the plotting
+      coordinates, one per row
+    """
+    # Copies of the relevant expressions
+    distributed_load_plot = segment.distributed_load.expression
+    shear_force_plot = segment.shear_force
+    bending_moment_plot = segment.bending_moment
+    deflection_plot = segment.deflection
+    x_start_plot = segment.x_start
+    x_end_plot = segment.x_end
+
+    # User defined substitutions
+    distributed_load_plot = distributed_load_plot.subs(subs)
+    shear_force_plot = shear_force_plot.subs(subs)
+    bending_moment_plot = bending_moment_plot.subs(subs)
+    deflection_plot = deflection_plot.subs(subs)
+    x_start_plot = x_start_plot.subs(subs)
+    x_end_plot = x_end_plot.subs(subs)
+
+    # Create new expressions by substituting all remaining symbolic variables with '1',
+    # except for the x variable. The variables of all expressions are gathered in a single
+    # set, such that every expression is replaced in a single pass. The keys are plain
+    # symbols, hence, a structural replacement is enough.
+    variables = (
+        distributed_load_plot.free_symbols
+        | shear_force_plot.free_symbols
+        | bending_moment_plot.free_symbols
+        | deflection_plot.free_symbols
+        | x_start_plot.free_symbols
+        | x_end_plot.free_symbols
+    )
+    variables.discard(x)
+    substitution_one = {ivariable: sym.S.One for ivariable in variables}
+    distributed_load_plot = distributed_load_plot.xreplace(substitution_one)
+    shear_force_plot = shear_force_plot.xreplace(substitution_one)
+    bending_moment_plot = bending_moment_plot.xreplace(substitution_one)
+    deflection_plot = deflection_plot.xreplace(substitution_one)
+    x_start_plot = x_start_plot.xreplace(substitution_one)
+    x_end_plot = x_end_plot.xreplace(substitution_one)
+
+    # Numeric plotting x variable, obtained by mapping the reference grid onto the
+    # segment.
+    x_start_numeric = float(x_start_plot)
+    x_end_numeric = float(x_end_plot)
+    if all(
+        _is_linear(iexpr)
+        for iexpr in (
+            distributed_load_plot,
+            shear_force_plot,
+            bending_moment_plot,
+            deflection_plot,
+        )
+    ):
+        u_segment = _PLOT_GRID_LINEAR
+    else:
+        u_segment = _PLOT_GRID
+    x_plot = x_start_numeric + (x_end_numeric - x_start_numeric) * u_segment
+
+    # Evaluate the diagrams of the segment into a single block of memory, one row per
+    # diagram. A new block is used for each segment, as the plotted lines keep references
+    # to the arrays.
+    values_numeric = _compile_diagrams(
+        (distributed_load_plot, shear_force_plot, bending_moment_plot, deflection_plot)
+    )(x_plot)
+
+    return x_plot, values_numeric
+
+
+# ================================================================================ is_linear
+def _is_linear(expr):
+    """Checks if a SymPy expression is a polynomial of at most first degree in x.
+
+    Parameters
+    ----------
+    expr : SymPy expression
+      Input expression
+
+    Returns
+    -------
+    flag : bool
+      Flags if the expression is linear in x
+    """
+    return bool(expr.is_polynomial(x) and sym.degree(expr, x) <= 1)
+
+
+# ========================================================================= compile_diagrams
+def _compile_diagrams(exprs):
+    """Converts the SymPy expressions of x of the diagrams of a segment into a single
+    numeric function, sharing the common subexpressions of the diagrams.
+
+    Parameters
+    ----------
+    exprs : sequence of SymPy expressions
+      Input expressions, depending at most on the x variable
+
+    Returns
+    -------
+    function : callable
+      Function evaluating the expressions over a NumPy array of coordinates. The values are
+      written into the optional output array, one row per expression, which is allocated
+      when not provided, and returned
+    """
+    exprs = list(exprs)
+    lambdified = sym.lambdify(x, exprs, modules="numpy", cse=True)
+
+    def function(x_numeric, out=None):
+        if out is None:
+            out = np.empty((len(exprs), np.size(x_numeric)))
+        # Constant expressions are lambdified into scalars, which are broadcast to the
+        # whole row.
+        for irow, ivalues in zip(out, lambdified(x_numeric)):
+            np.copyto(irow, ivalues)
+
+        return out
+
+    return function
 
 
 # ==========================================================================================
@@ -13,6 +13,9 @@ of the equilibirum equations.
 
 ..moduleauthor:: A. M. Couto Carneiro <amcc@fe.up.pt>
 """
+import functools
+
+import numpy as np
 import sympy as sym
 
 from sympy.abc import x
@@ -22,35 +25,201 @@ from sympy.abc import x
 class distributed_load:
     """Distributed transverse load class."""
 
-    def __init__(self, x_start, x_end, expression):
-        self.x_start = sym.sympify(x_start)
-        self.x_end = sym.sympify(x_end)
-        self.expression = sym.sympify(expression)
+    __slots__ = (
+        "x_start",
+        "x_end",
+        "expression",
+        "_equivalent_force",
+        "_equivalent_moment",
+    )
 
-        self.equivalent_force = sym.integrate(
-            self.expression, (x, self.x_start, self.x_end)
-        )
-        self.equivalent_moment = sym.integrate(
-            self.expression * x, (x, self.x_start, self.x_end)
-        )
+    def __init__(self, x_start, x_end, expression):
+        self.x_start = _sympify(x_start)
+        self.x_end = _sympify(x_end)
+        self.expression = _sympify(expression)
+        # Resultants assigned by the user, otherwise, integrated when first required.
+        self._equivalent_force = None
+        self._equivalent_moment = None
+
+    # --------------------------------------------------------------------- equivalent_force
+    @property
+    def equivalent_force(self):
+        """Resultant force of the distributed load, only integrated when first required.
+
+        Returns
+        -------
+        equivalent_force : SymPy expression
+          Resultant force of the distributed load
+        """
+        if self._equivalent_force is not None:
+            return self._equivalent_force
+
+        return _equivalent_loads(self.expression, self.x_start, self.x_end)[0]
+
+    @equivalent_force.setter
+    def equivalent_force(self, value):
+        self._equivalent_force = value
+
+    # -------------------------------------------------------------------- equivalent_moment
+    @property
+    def equivalent_moment(self):
+        """Resultant moment of the distributed load with respect to the origin, only
+        integrated when first required.
+
+        Returns
+        -------
+        equivalent_moment : SymPy expression
+          Resultant moment of the distributed load
+        """
+        if self._equivalent_moment is not None:
+            return self._equivalent_moment
+
+        return _equivalent_loads(self.expression, self.x_start, self.x_end)[1]
+
+    @equivalent_moment.setter
+    def equivalent_moment(self, value):
+        self._equivalent_moment = value
+
+    # --------------------------------------------------------------------------- as_numeric
+    def as_numeric(self):
+        """Numeric function evaluating the distributed load expression, for the evaluation
+        of the load at many points. The function is generated once per expression.
+
+        Returns
+        -------
+        function : callable
+          Function evaluating the distributed load over a NumPy array of coordinates
+        """
+        if self.expression.free_symbols - {x}:
+            raise RuntimeError(
+                "The distributed load expression {0} must depend at most on the "
+                "x variable to be evaluated numerically.".format(self.expression)
+            )
+
+        return _lambdify(self.expression)
 
 
 # =============================================================================== point_load
 class point_load:
     """Concentrated transverse point load."""
 
+    __slots__ = ("x_coord", "value")
+
     def __init__(self, x_coord, value):
-        self.x_coord = sym.sympify(x_coord)
-        self.value = sym.sympify(value)
+        self.x_coord = _sympify(x_coord)
+        self.value = _sympify(value)
 
 
 # ============================================================================= point_moment
 class point_moment:
     """Concentrated point moment."""
 
+    __slots__ = ("x_coord", "value")
+
     def __init__(self, x_coord, value):
-        self.x_coord = sym.sympify(x_coord)
-        self.value = sym.sympify(value)
+        self.x_coord = _sympify(x_coord)
+        self.value = _sympify(value)
+
+
+# ========================================================================= equivalent_loads
+@functools.lru_cache(maxsize=1024)
+def _equivalent_loads(expression, x_start, x_end):
+    """Computes the resultant force and moment of a distributed load. The integrals are
+    memoised, as the same loads are repeatedly found when creating the beam segments.
+
+    Parameters
+    ----------
+    expression : SymPy expression
+      Distributed loading expression
+    x_start : SymPy expression
+      Starting coordinate of the distributed load
+    x_end : SymPy expression
+      Ending coordinate of the distributed load
+
+    Returns
+    -------
+    equivalent_force : SymPy expression
+      Resultant force of the distributed load
+    equivalent_moment : SymPy expression
+      Resultant moment of the distributed load with respect to the origin
+    """
+    # Segments without distributed load are the most common case.
+    if expression == sym.S.Zero:
+        return sym.S.Zero, sym.S.Zero
+
+    equivalent_force = sym.integrate(expression, (x, x_start, x_end))
+    equivalent_moment = sym.integrate(expression * x, (x, x_start, x_end))
+
+    return equivalent_force, equivalent_moment
+
+
+# ================================================================================= lambdify
+@functools.lru_cache(maxsize=1024)
+def _lambdify(expression):
+    """Generates a NumPy function from a distributed loading expression.
+
+    Parameters
+    ----------
+    expression : SymPy expression
+      Distributed loading expression, depending at most on the x variable
+
+    Returns
+    -------
+    function : callable
+      Function evaluating the expression over a NumPy array of coordinates
+    """
+    lambdified = sym.lambdify(x, expression, modules="numpy", cse=True)
+
+    def function(x_numeric):
+        # Constant expressions are lambdified into scalars, which are broadcast to the
+        # shape of the coordinates.
+        x_numeric = np.asarray(x_numeric, dtype=float)
+        return np.broadcast_to(lambdified(x_numeric), x_numeric.shape).astype(float)
+
+    return function
+
+
+# ================================================================================== sympify
+def _sympify(value):
+    """Converts the input into a SymPy object, returning SymPy objects as they are. The
+    conversion of hashable inputs, such as numbers and strings, is memoised.
+
+    Parameters
+    ----------
+    value : sympifiable type (int, float, string, SymPy symbol, etc)
+      Input value
+
+    Returns
+    -------
+    expr : SymPy expression
+      Sympified value
+    """
+    if isinstance(value, sym.Basic):
+        return value
+
+    try:
+        return _sympify_cached(value)
+    except TypeError:
+        # Unhashable input.
+        return sym.sympify(value)
+
+
+# =========================================================================== sympify_cached
+@functools.lru_cache(maxsize=4096, typed=True)
+def _sympify_cached(value):
+    """Memoised conversion of a hashable input into a SymPy object.
+
+    Parameters
+    ----------
+    value : hashable sympifiable type (int, float, string, etc)
+      Input value
+
+    Returns
+    -------
+    expr : SymPy expression
+      Sympified value
+    """
+    return sym.sympify(value)
 
 
 # ==========================================================================================
@@ -15,26 +15,81 @@ moments and changes of beam properties.
 
 ..moduleauthor:: A. M. Couto Carneiro <amcc@fe.up.pt>
 """
+import collections
+
 from abc import ABC, abstractmethod
 
 import matplotlib.patches as patches
+import numpy as np
 import sympy as sym
 
 from sympy.abc import x
 
+from symbeam.load import _sympify
+
 
 # Set numerical tolerance
 tol = 1e-6
+
+# Limits and aspect ratio of the axis in which the points are drawn, together with the
+# diameters of the arcs representing the point moments.
+plot_context = collections.namedtuple(
+    "plot_context",
+    [
+        "xmin",
+        "xmax",
+        "xspan",
+        "ymin",
+        "ymax",
+        "yspan",
+        "ymid",
+        "axis_scale",
+        "arc_diameterx",
+        "arc_diametery",
+    ],
+)
+
+# Styles of the markers, (marker, size, face color, edge width, edge color), and lines,
+# (color, width), representing the points.
+_PIN_TRIANGLE = ("^", 20, "silver", 1, "black")
+_ROLLER_TRIANGLE = ("^", 15, "silver", 1, "black")
+_ROLLER_WHEEL = ("o", 6, "black", 0, "black")
+_HINGE_CIRCLE = ("o", 8, "white", 1.5, "black")
+_SILVER_LINE = ("silver", 5)
+_BLACK_LINE = ("black", 1.5)
+
+
 # ==================================================================================== point
 class point(ABC):
     """Abstract definition of a beam point."""
 
+    __slots__ = (
+        "x_coord",
+        "reaction_force",
+        "reaction_moment",
+        "external_force",
+        "external_moment",
+        "_numeric_x_coord",
+        "_numeric_coordinates",
+    )
+
+    # Flags of the boundary conditions set by the point, known for each type of point.
+    HAS_DEFLECTION_BC = True
+    HAS_ROTATION_BC = True
+
     def __init__(self, x_coord):
-        self.x_coord = sym.sympify(x_coord)
-        self.reaction_force = sym.sympify(0)
-        self.reaction_moment = sym.sympify(0)
-        self.external_force = sym.sympify(0)
-        self.external_moment = sym.sympify(0)
+        self.x_coord = _sympify(x_coord)
+        self.reaction_force = sym.S.Zero
+        self.reaction_moment = sym.S.Zero
+        self.external_force = sym.S.Zero
+        self.external_moment = sym.S.Zero
+        # Numeric coordinate of the point, if it does not depend on any symbol, otherwise,
+        # the numeric coordinates for each set of user substitutions.
+        if self.x_coord.is_number:
+            self._numeric_x_coord = float(self.x_coord)
+        else:
+            self._numeric_x_coord = None
+        self._numeric_coordinates = {}
 
     # ----------------------------------------------------------------------------- get_name
     @staticmethod
@@ -118,16 +173,44 @@ class point(ABC):
           Number of fixed degrees of freedom at the point
         """
 
-    # --------------------------------------------------------------------------- draw_point
+    # -------------------------------------------------------------------- get_point_artists
     @abstractmethod
-    def draw_point(self, ax):
+    def get_point_artists(self, x_coord_plot, context):
+        """Returns the markers and lines representing the point, such that the artists of
+        several points can be drawn at once.
+
+        Parameters
+        ----------
+        x_coord_plot : float
+          Numerical value of point coordinate
+        context : plot_context
+          Limits and aspect ratio of the axis
+
+        Returns
+        -------
+        artists : list of tuples
+          Artists of the point, as (kind, style, data) tuples. Markers ("marker") have the
+          style (marker, size, face color, edge width, edge color) and the data (x, y).
+          Lines ("line") have the style (color, width) and the data ((x0, y0), (x1, y1))
+        """
+
+    # --------------------------------------------------------------------------- draw_point
+    def draw_point(self, x_coord_plot, ax, context=None):
         """Draws the point in the given axis.
 
         Parameters
         ----------
+        x_coord_plot : float
+          Numerical value of point coordinate
         ax : Matplotlib axis object
           Axis where to draw the point
+        context : plot_context
+          Limits and aspect ratio of the axis, queried from the axis if not provided
         """
+        if context is None:
+            context = get_plot_context(ax)
+
+        _draw_artists(ax, self.get_point_artists(x_coord_plot, context))
 
     # ------------------------------------------------------------- has_deflection_condition
     def has_deflection_condition(self):
@@ -138,7 +221,7 @@ class point(ABC):
         flag : bool
           Flags if the current support sets a deflection boundary condition
         """
-        return not (self.is_method_empty(self.get_deflection_boundary_condition))
+        return self.HAS_DEFLECTION_BC
 
     # --------------------------------------------------------------- has_rotation_condition
     def has_rotation_condition(self):
@@ -149,11 +232,55 @@ class point(ABC):
         flag : bool
           Flags if the current support sets a rotation boundary condition
         """
-        return not (self.is_method_empty(self.get_rotation_boundary_condition))
+        return self.HAS_ROTATION_BC
+
+    # ----------------------------------------------------------------- fixed_and_continuity
+    def _fixed_and_continuity(self, list_expr):
+        """Sets the rotation or deflection to zero at the point and, if it joins two
+        segments, enforces its continuity.
+
+        Parameters
+        ----------
+        list_expr : list of SymPy expressions
+          List of the rotation or deflection expressions associated with a point as
+          function of x and the integration constants
+
+        Returns
+        -------
+        equations : list of SymPy expressions
+          List of equations setting the boundary conditions at the point
+        """
+        at_point = {x: self.x_coord}
+        fixed_equation = list_expr[0].xreplace(at_point)
+        if len(list_expr) == 2:
+            return [fixed_equation, (list_expr[0] - list_expr[1]).xreplace(at_point)]
+
+        return [fixed_equation]
 
-    # ---------------------------------------------------- set_geometric_boundary_conditions
-    def set_geometric_boundary_conditions(self, list_rotation, list_deflection, equations):
-        """Sets the geometric boundary conditions on the global system of equations.
+    # ---------------------------------------------------------------------- continuity_only
+    def _continuity_only(self, list_expr):
+        """Enforces the continuity of the rotation or deflection at the point, if it joins
+        two segments.
+
+        Parameters
+        ----------
+        list_expr : list of SymPy expressions
+          List of the rotation or deflection expressions associated with a point as
+          function of x and the integration constants
+
+        Returns
+        -------
+        equations : list of SymPy expressions
+          List of equations setting the boundary conditions at the point
+        """
+        if len(list_expr) == 2:
+            return [(list_expr[0] - list_expr[1]).xreplace({x: self.x_coord})]
+
+        return []
+
+    # ---------------------------------------------------- get_geometric_boundary_conditions
+    def get_geometric_boundary_conditions(self, list_rotation, list_deflection):
+        """Establishes the geometric boundary conditions on the current point.
 
         Parameters
         ----------
@@ -163,43 +290,24 @@ class point(ABC):
         list_deflection : list of SymPy expressions
           List of the deflection expressions associated with a point as function of x and
           the integration constants
+
+        Returns
+        -------
         equations : list of SymPy expressions
-          List of global geometric boundary condition equations
+          List of equations setting the rotation and deflection boundary conditions at the
+          point
         """
+        equations = []
         if self.has_rotation_condition():
-            condition_equation = self.get_rotation_boundary_condition(list_rotation)
-            equations.extend(condition_equation)
+            equations.extend(self.get_rotation_boundary_condition(list_rotation))
 
         if self.has_deflection_condition():
-            condition_equation = self.get_deflection_boundary_condition(list_deflection)
-            equations.extend(condition_equation)
-
-    # ---------------------------------------------------------------------- is_method_empty
-    @staticmethod
-    def is_method_empty(func):
-        """Detects if a method is empty by comparing the bytecode instructions with an
-        empty function with and without docstring documentation.
+            equations.extend(self.get_deflection_boundary_condition(list_deflection))
 
-        Parameters
-        ----------
-        func : Python function
-          Function to check
-        """
-
-        def empty_func():
-            pass
-
-        def empty_func_with_doc():
-            """Empty function with docstring."""
-            pass
-
-        return (
-            func.__code__.co_code == empty_func.__code__.co_code
-            or func.__code__.co_code == empty_func_with_doc.__code__.co_code
-        )
+        return equations
 
     # --------------------------------------------------------------- get_numeric_coordinate
-    def get_numeric_coordinate(self, input_substitution={}):
+    def get_numeric_coordinate(self, input_substitution=None):
         """Returns the coordinate of the point, by substituting all present symbols byb 1.
 
         Parameters
@@ -209,31 +317,58 @@ class point(ABC):
 
         Returns
         -------
-        x_coord_plot : SymPy float
+        x_coord_plot : float
           Numerical value of point coordinate
         """
-        x_coord_plot = self.x_coord
-        input_substitution.pop("x", None)
-        x_coord_plot = x_coord_plot.subs(input_substitution)
-        for ivariable in x_coord_plot.free_symbols:
-            x_coord_plot = x_coord_plot.subs({ivariable: 1})
+        # Numeric coordinates do not depend on the substitutions.
+        if self._numeric_x_coord is not None:
+            return self._numeric_x_coord
+
+        # Remove the 'x' variable from the user substitutions, without modifying them.
+        if input_substitution is None:
+            input_substitution = {}
+        elif "x" in input_substitution:
+            input_substitution = {
+                key: value for key, value in input_substitution.items() if key != "x"
+            }
+
+        # The point is drawn several times with the same substitutions, hence, the numeric
+        # coordinate is memoised.
+        key = frozenset(input_substitution.items())
+        x_coord_plot = self._numeric_coordinates.get(key)
+        if x_coord_plot is None:
+            # The user substitutions may be keyed by the names of the symbols, hence, they
+            # go through subs. The remaining symbols are replaced at once by structural
+            # replacement.
+            x_coord_plot = self.x_coord.subs(input_substitution)
+            x_coord_plot = float(
+                x_coord_plot.xreplace(
+                    {ivariable: sym.S.One for ivariable in x_coord_plot.free_symbols}
+                )
+            )
+            self._numeric_coordinates[key] = x_coord_plot
 
         return x_coord_plot
 
     # ------------------------------------------------------------------------- draw_support
-    def draw_support(self, ax, input_substitution={}):
+    def draw_support(self, ax, input_substitution=None, context=None):
         """Draws the point in the axis.
 
         Parameters
         ----------
         ax : Matplotlib axis object
           Axis where to draw the point
+        context : plot_context
+          Limits and aspect ratio of the axis, queried from the axis if not provided
         """
+        if context is None:
+            context = get_plot_context(ax)
+
         x_coord_plot = self.get_numeric_coordinate(input_substitution=input_substitution)
-        self.draw_point(x_coord_plot, ax)
+        self.draw_point(x_coord_plot, ax, context)
 
     # --------------------------------------------------------------------------- draw_force
-    def draw_force(self, ax, length, input_substitution={}):
+    def draw_force(self, ax, length, input_substitution=None, context=None):
         """Draws a point force in the axis.
 
         Parameters
@@ -242,11 +377,16 @@ class point(ABC):
           Axis where to draw the point force
         length : float
           Length of the force in the figure
+        context : plot_context
+          Limits and aspect ratio of the axis, queried from the axis if not provided
         """
+        if context is None:
+            context = get_plot_context(ax)
+
         x_coord_plot = self.get_numeric_coordinate(input_substitution=input_substitution)
         # Set the geometry scale (heuristic).
-        scale_x = ax.get_xlim()[1] - ax.get_xlim()[0]
-        scale_y = ax.get_ylim()[1] - ax.get_ylim()[0]
+        scale_x = context.xspan
+        scale_y = context.yspan
         width = 0.002
         head_width = width * 7 * scale_x
         head_length = width * 35 * scale_y
@@ -268,7 +408,7 @@ class point(ABC):
         )
 
     # -------------------------------------------------------------------------- draw_moment
-    def draw_moment(self, ax, value, input_substitution={}):
+    def draw_moment(self, ax, value, input_substitution=None, context=None):
         """Draws a point moment in the axis.
 
         Parameters
@@ -277,22 +417,16 @@ class point(ABC):
           Axis where to draw the point moment
         value : float
           Relative absolute value the moment, relative to all present moments in the beam
+        context : plot_context
+          Limits and aspect ratio of the axis, queried from the axis if not provided
         """
+        if context is None:
+            context = get_plot_context(ax)
+
         x_coord_plot = self.get_numeric_coordinate(input_substitution=input_substitution)
         color = "firebrick"
-        # Get the limits of the x- and y-axis
-        xlim = ax.get_xlim()
-        xmin = xlim[0]
-        xmax = xlim[1]
-        xspan = xmax - xmin
-
-        ylim = ax.get_ylim()
-        ymin = ylim[0]
-        ymax = ylim[1]
-        yspan = ymax - ymin
 
         # Set the starting and ending angles of the arc.
-        diameter = xspan / 25
         if value > 0:
             start_angle = 105
             end_angle = 90
@@ -300,17 +434,10 @@ class point(ABC):
             start_angle = 90
             end_angle = 75
 
-        # In order to draw an approximately circular arc, get the aspect ratio associated
-        # with the data and the figure/axis itself, and scale the diameter.
-        bbox = ax.get_window_extent()
-        width, height = bbox.width, bbox.height
-
-        data_scale = yspan / xspan
-        axis_scale = width / height
-
+        # The diameters of the approximately circular arc only depend on the axis.
         angle = 0
-        diameterx = diameter
-        diametery = diameter * data_scale * axis_scale
+        diameterx = context.arc_diameterx
+        diametery = context.arc_diametery
 
         linewidth = 1 + abs(value) * 1
         markersize = 3 + abs(value) * 4
@@ -368,6 +495,8 @@ class point(ABC):
 class pin(point):
     """Concrete implementation of a pinned support."""
 
+    __slots__ = ()
+
     @staticmethod
     def get_name():
         return "Pinned Support"
@@ -386,73 +515,44 @@ class pin(point):
 
     # --------------------------------------------------------------------------------------
     def get_deflection_boundary_condition(self, list_deflection):
-        fixed_equation = list_deflection[0].subs({x: self.x_coord})
-        if len(list_deflection) == 2:
-            deflection_continuous = list_deflection[0].subs(
-                {x: self.x_coord}
-            ) - list_deflection[1].subs({x: self.x_coord})
-            equations = [fixed_equation, deflection_continuous]
-        else:
-            equations = [fixed_equation]
-
-        return equations
+        return self._fixed_and_continuity(list_deflection)
 
     # --------------------------------------------------------------------------------------
     def get_rotation_boundary_condition(self, list_rotation):
-        if len(list_rotation) == 2:
-            rotation_continuous = list_rotation[0].subs({x: self.x_coord}) - list_rotation[
-                1
-            ].subs({x: self.x_coord})
-            equations = [rotation_continuous]
-        else:
-            equations = []
-
-        return equations
+        return self._continuity_only(list_rotation)
 
     # --------------------------------------------------------------------------------------
-    def draw_point(self, x_coord_plot, ax):
-        # Get the limits of the x- and y-axis
-        xlim = ax.get_xlim()
-        xmin = xlim[0]
-        xmax = xlim[1]
-        xspan = xmax - xmin
-
-        ylim = ax.get_ylim()
-        ymin = ylim[0]
-        ymax = ylim[1]
-        yspan = ymax - ymin
-        ymid = (ymax + ymin) / 2
-
-        # Draw the triangle.
-        length_bottom_line = xspan / 20
-        ax.plot(
-            x_coord_plot,
-            ymid - yspan / 11,
-            marker="^",
-            clip_on=False,
-            markersize=20,
-            markerfacecolor="silver",
-            markeredgewidth=1,
-            markeredgecolor="black",
-        )
+    def get_point_artists(self, x_coord_plot, context):
+        # Get the span of the x- and y-axis
+        xspan = context.xspan
+        yspan = context.yspan
+        ymid = context.ymid
 
-        # Draw the final line.
-        ax.plot(
-            [x_coord_plot - length_bottom_line / 2, x_coord_plot + length_bottom_line / 2],
-            [ymid - yspan / 5, ymid - yspan / 5],
-            color="silver",
-            linewidth=5,
-            clip_on=False,
-            solid_capstyle="butt",
-        )
-        ax.plot(
-            [x_coord_plot - length_bottom_line / 2, x_coord_plot + length_bottom_line / 2],
-            [ymid - yspan / 5.5, ymid - yspan / 5.5],
-            color="black",
-            linewidth=1.5,
-            clip_on=False,
-            solid_capstyle="butt",
+        # The triangle and the final line.
+        length_bottom_line = xspan / 20
+        x_bottom_line = (
+            x_coord_plot - length_bottom_line / 2,
+            x_coord_plot + length_bottom_line / 2,
         )
+        return [
+            ("marker", _PIN_TRIANGLE, (x_coord_plot, ymid - yspan / 11)),
+            (
+                "line",
+                _SILVER_LINE,
+                (
+                    (x_bottom_line[0], ymid - yspan / 5),
+                    (x_bottom_line[1], ymid - yspan / 5),
+                ),
+            ),
+            (
+                "line",
+                _BLACK_LINE,
+                (
+                    (x_bottom_line[0], ymid - yspan / 5.5),
+                    (x_bottom_line[1], ymid - yspan / 5.5),
+                ),
+            ),
+        ]
 
 
 # =================================================================================== roller
@@ -461,6 +561,8 @@ class roller(point):
     loads on the beam).
     """
 
+    __slots__ = ()
+
     @staticmethod
     def get_name():
         return "Roller"
@@ -475,98 +577,53 @@ class roller(point):
         return 1
 
     def get_deflection_boundary_condition(self, list_deflection):
-        fixed_equation = list_deflection[0].subs({x: self.x_coord})
-        if len(list_deflection) == 2:
-            deflection_continuous = list_deflection[0].subs(
-                {x: self.x_coord}
-            ) - list_deflection[1].subs({x: self.x_coord})
-            equations = [fixed_equation, deflection_continuous]
-        else:
-            equations = [fixed_equation]
-
-        return equations
+        return self._fixed_and_continuity(list_deflection)
 
     def get_rotation_boundary_condition(self, list_rotation):
-        if len(list_rotation) == 2:
-            rotation_continuous = list_rotation[0].subs({x: self.x_coord}) - list_rotation[
-                1
-            ].subs({x: self.x_coord})
-            equations = [rotation_continuous]
-        else:
-            equations = []
+        return self._continuity_only(list_rotation)
 
-        return equations
+    def get_point_artists(self, x_coord_plot, context):
+        # Get the span of the x- and y-axis
+        xspan = context.xspan
+        yspan = context.yspan
 
-    def draw_point(self, x_coord_plot, ax):
-        # Get the limits of the x- and y-axis
-        xlim = ax.get_xlim()
-        xmin = xlim[0]
-        xmax = xlim[1]
-        xspan = xmax - xmin
-
-        ylim = ax.get_ylim()
-        ymin = ylim[0]
-        ymax = ylim[1]
-        yspan = ymax - ymin
-
-        # Draw the triangle.
+        # The triangle, the circles and the final line.
         length_bottom_line = xspan / 20
-        ax.plot(
-            x_coord_plot,
-            -yspan / 15.5,
-            marker="^",
-            clip_on=False,
-            markersize=15,
-            markerfacecolor="silver",
-            markeredgewidth=1,
-            markeredgecolor="black",
-        )
-
-        # Draw the circles.
-        ax.plot(
-            x_coord_plot + xspan / 100,
-            -yspan / 6.8,
-            marker="o",
-            clip_on=False,
-            markersize=6,
-            markerfacecolor="black",
-            markeredgewidth=0,
-            markeredgecolor="black",
-        )
-        ax.plot(
-            x_coord_plot - xspan / 100,
-            -yspan / 6.8,
-            marker="o",
-            clip_on=False,
-            markersize=6,
-            markerfacecolor="black",
-            markeredgewidth=0,
-            markeredgecolor="black",
-        )
-
-        # Draw the final line.
-        ax.plot(
-            [x_coord_plot - length_bottom_line / 2, x_coord_plot + length_bottom_line / 2],
-            [-yspan / 5, -yspan / 5],
-            color="silver",
-            linewidth=5,
-            clip_on=False,
-            solid_capstyle="butt",
-        )
-        ax.plot(
-            [x_coord_plot - length_bottom_line / 2, x_coord_plot + length_bottom_line / 2],
-            [-yspan / 5.5, -yspan / 5.5],
-            color="black",
-            linewidth=1.5,
-            clip_on=False,
-            solid_capstyle="butt",
+        x_bottom_line = (
+            x_coord_plot - length_bottom_line / 2,
+            x_coord_plot + length_bottom_line / 2,
         )
+        return [
+            ("marker", _ROLLER_TRIANGLE, (x_coord_plot, -yspan / 15.5)),
+            (
+                "marker",
+                _ROLLER_WHEEL,
+                (x_coord_plot + xspan / 100, -yspan / 6.8),
+            ),
+            (
+                "marker",
+                _ROLLER_WHEEL,
+                (x_coord_plot - xspan / 100, -yspan / 6.8),
+            ),
+            (
+                "line",
+                _SILVER_LINE,
+                ((x_bottom_line[0], -yspan / 5), (x_bottom_line[1], -yspan / 5)),
+            ),
+            (
+                "line",
+                _BLACK_LINE,
+                ((x_bottom_line[0], -yspan / 5.5), (x_bottom_line[1], -yspan / 5.5)),
+            ),
+        ]
 
 
 # =============================================================================== continuity
 class continuity(point):
     """Concrete implementation of a continuity point in a beam."""
 
+    __slots__ = ()
+
     @staticmethod
     def get_name():
         return "Continuity point"
@@ -581,35 +638,21 @@ class continuity(point):
         return 0
 
     def get_deflection_boundary_condition(self, list_deflection):
-        if len(list_deflection) == 2:
-            deflection_continuous = list_deflection[0].subs(
-                {x: self.x_coord}
-            ) - list_deflection[1].subs({x: self.x_coord})
-            equations = [deflection_continuous]
-        else:
-            equations = []
-
-        return equations
+        return self._continuity_only(list_deflection)
 
     def get_rotation_boundary_condition(self, list_rotation):
-        if len(list_rotation) == 2:
-            rotation_continuous = list_rotation[0].subs({x: self.x_coord}) - list_rotation[
-                1
-            ].subs({x: self.x_coord})
-            equations = [rotation_continuous]
-        else:
-            equations = []
+        return self._continuity_only(list_rotation)
 
-        return equations
-
-    def draw_point(self, x_coord_plot, ax):
-        pass
+    def get_point_artists(self, x_coord_plot, context):
+        return []
 
 
 # ==================================================================================== fixed
 class fixed(point):
     """Concrete implementation of a fixed/clamped support."""
 
+    __slots__ = ()
+
     @staticmethod
     def get_name():
         return "Fixed"
@@ -624,107 +667,50 @@ class fixed(point):
         return 3
 
     def get_deflection_boundary_condition(self, list_deflection):
-        fixed_equation = list_deflection[0].subs({x: self.x_coord})
-        if len(list_deflection) == 2:
-            deflection_continuous = list_deflection[0].subs(
-                {x: self.x_coord}
-            ) - list_deflection[1].subs({x: self.x_coord})
-            equations = [fixed_equation, deflection_continuous]
-        else:
-            equations = [fixed_equation]
-
-        return equations
+        return self._fixed_and_continuity(list_deflection)
 
     def get_rotation_boundary_condition(self, list_rotation):
-        fixed_equation = list_rotation[0].subs({x: self.x_coord})
-        if len(list_rotation) == 2:
-            rotation_continuous = list_rotation[0].subs({x: self.x_coord}) - list_rotation[
-                1
-            ].subs({x: self.x_coord})
-            equations = [fixed_equation, rotation_continuous]
-        else:
-            equations = [fixed_equation]
-
-        return equations
+        return self._fixed_and_continuity(list_rotation)
 
-    def draw_point(self, x_coord_plot, ax):
+    def get_point_artists(self, x_coord_plot, context):
         # Get the limits of the x- and y-axis
-        xlim = ax.get_xlim()
-        xmin = xlim[0]
-        xmax = xlim[1]
-        xspan = xmax - xmin
+        xmin = context.xmin
+        xspan = context.xspan
+        yspan = context.yspan
 
-        ylim = ax.get_ylim()
-        ymin = ylim[0]
-        ymax = ylim[1]
-        yspan = ymax - ymin
-
-        # Draw the triangle.
+        # The vertical lines, with the silver one on the outer side of the beam.
+        y_line = (-yspan / 15.5, yspan / 15.5)
         if abs(x_coord_plot - xmin) < tol:
-            ax.plot(
-                [x_coord_plot - xspan / 150, x_coord_plot - xspan / 150],
-                [-yspan / 15.5, yspan / 15.5],
-                color="silver",
-                linewidth=5,
-                clip_on=False,
-                solid_capstyle="butt",
-            )
-            ax.plot(
-                [x_coord_plot, x_coord_plot],
-                [-yspan / 15.5, yspan / 15.5],
-                color="black",
-                linewidth=1.5,
-                clip_on=False,
-                solid_capstyle="butt",
-            )
+            x_silver = [x_coord_plot - xspan / 150]
+            x_black = [x_coord_plot]
         elif abs(x_coord_plot - xmin) > tol:
-            ax.plot(
-                [x_coord_plot + xspan / 150, x_coord_plot + xspan / 150],
-                [-yspan / 15.5, yspan / 15.5],
-                color="silver",
-                linewidth=5,
-                clip_on=False,
-                solid_capstyle="butt",
-            )
-            ax.plot(
-                [x_coord_plot, x_coord_plot],
-                [-yspan / 15.5, yspan / 15.5],
-                color="black",
-                linewidth=1.5,
-                clip_on=False,
-                solid_capstyle="butt",
-            )
+            x_silver = [x_coord_plot + xspan / 150]
+            x_black = [x_coord_plot]
         else:
-            ax.plot(
-                [x_coord_plot, x_coord_plot],
-                [-yspan / 15.5, yspan / 15.5],
-                color="silver",
-                linewidth=5,
-                clip_on=False,
-                solid_capstyle="butt",
-            )
-            ax.plot(
-                [x_coord_plot - xspan / 150, x_coord_plot - xspan / 150],
-                [-yspan / 15.5, yspan / 15.5],
-                color="black",
-                linewidth=1.5,
-                clip_on=False,
-                solid_capstyle="butt",
-            )
-            ax.plot(
-                [x_coord_plot + xspan / 150, x_coord_plot + xspan / 150],
-                [-yspan / 15.5, yspan / 15.5],
-                color="black",
-                linewidth=1.5,
-                clip_on=False,
-                solid_capstyle="butt",
-            )
+            x_silver = [x_coord_plot]
+            x_black = [x_coord_plot - xspan / 150, x_coord_plot + xspan / 150]
+
+        artists = [
+            ("line", _SILVER_LINE, ((x_line, y_line[0]), (x_line, y_line[1])))
+            for x_line in x_silver
+        ]
+        artists.extend(
+            ("line", _BLACK_LINE, ((x_line, y_line[0]), (x_line, y_line[1])))
+            for x_line in x_black
+        )
+
+        return artists
 
 
 # ==================================================================================== hinge
 class hinge(point):
     """Concrete implementation of a hinge."""
 
+    __slots__ = ()
+
+    # The rotation is discontinuous at the hinge.
+    HAS_ROTATION_BC = False
+
     @staticmethod
     def get_name():
         return "Hinge"
@@ -739,30 +725,127 @@ class hinge(point):
         return 0
 
     def get_deflection_boundary_condition(self, list_deflection):
-        if len(list_deflection) == 2:
-            deflection_continuous = list_deflection[0].subs(
-                {x: self.x_coord}
-            ) - list_deflection[1].subs({x: self.x_coord})
-            equations = [deflection_continuous]
-        else:
-            equations = []
-
-        return equations
+        return self._continuity_only(list_deflection)
 
     def get_rotation_boundary_condition(self, list_rotation):
-        pass
+        return []
 
-    def draw_point(self, x_coord_plot, ax):
-        ax.plot(
-            x_coord_plot,
-            0,
-            marker="o",
-            clip_on=False,
-            markersize=8,
-            markerfacecolor="white",
-            markeredgewidth=1.5,
-            markeredgecolor="black",
-        )
+    def get_point_artists(self, x_coord_plot, context):
+        return [("marker", _HINGE_CIRCLE, (x_coord_plot, 0))]
+
+
+# ========================================================================= get_plot_context
+def get_plot_context(ax):
+    """Gathers the limits and aspect ratio of an axis, such that they are queried once for
+    all points drawn in it.
+
+    Parameters
+    ----------
+    ax : Matplotlib axis object
+      Axis where to draw the points
+
+    Returns
+    -------
+    context : plot_context
+      Limits and aspect ratio of the axis, and diameters of the moment arcs
+    """
+    xmin, xmax = ax.get_xlim()
+    ymin, ymax = ax.get_ylim()
+    bbox = ax.get_window_extent()
+    xspan = xmax - xmin
+    yspan = ymax - ymin
+    axis_scale = bbox.width / bbox.height
+
+    # In order to draw an approximately circular arc, get the aspect ratio associated with
+    # the data and the figure/axis itself, and scale the diameter.
+    diameter = xspan / 25
+    data_scale = yspan / xspan
+
+    return plot_context(
+        xmin=xmin,
+        xmax=xmax,
+        xspan=xspan,
+        ymin=ymin,
+        ymax=ymax,
+        yspan=yspan,
+        ymid=(ymax + ymin) / 2,
+        axis_scale=axis_scale,
+        arc_diameterx=diameter,
+        arc_diametery=diameter * data_scale * axis_scale,
+    )
+
+
+# ============================================================================== draw_points
+def draw_points(points, ax, input_substitution=None, context=None):
+    """Draws several points in the axis, with a single plot call per style of marker or
+    line.
+
+    Parameters
+    ----------
+    points : list of point
+      Points to draw
+    ax : Matplotlib axis object
+      Axis where to draw the points
+    input_substitution : dictionary
+      User-specified symbols substitution for the symbolic expressions
+    context : plot_context
+      Limits and aspect ratio of the axis, queried from the axis if not provided
+    """
+    if context is None:
+        context = get_plot_context(ax)
+
+    artists = []
+    for ipoint in points:
+        x_coord_plot = ipoint.get_numeric_coordinate(input_substitution=input_substitution)
+        artists.extend(ipoint.get_point_artists(x_coord_plot, context))
+
+    _draw_artists(ax, artists)
+
+
+# ============================================================================= draw_artists
+def _draw_artists(ax, artists):
+    """Draws the artists of the points, grouped by kind and style. The groups are drawn in
+    the order they are first found, such that the layering of each point is kept.
+
+    Parameters
+    ----------
+    ax : Matplotlib axis object
+      Axis where to draw the points
+    artists : list of tuples
+      Artists of the points, as returned by get_point_artists
+    """
+    groups = collections.OrderedDict()
+    for kind, style, data in artists:
+        groups.setdefault((kind, style), []).append(data)
+
+    for (kind, style), data in groups.items():
+        if kind == "marker":
+            marker, markersize, markerfacecolor, markeredgewidth, markeredgecolor = style
+            x_plot, y_plot = zip(*data)
+            ax.plot(
+                x_plot,
+                y_plot,
+                linestyle="none",
+                marker=marker,
+                clip_on=False,
+                markersize=markersize,
+                markerfacecolor=markerfacecolor,
+                markeredgewidth=markeredgewidth,
+                markeredgecolor=markeredgecolor,
+            )
+        else:
+            # The lines are separated by NaN entries, such that they are drawn at once.
+            color, linewidth = style
+            line_plot = np.full((len(data), 3, 2), np.nan)
+            line_plot[:, :2, :] = data
+            ax.plot(
+                line_plot[:, :, 0].ravel(),
+                line_plot[:, :, 1].ravel(),
+                color=color,
+                linewidth=linewidth,
+                clip_on=False,
+                solid_capstyle="butt",
+            )
 
 
 # ==========================================================================================
@@ -1,9 +1,11 @@
+import numpy as np
 import pytest
 import sympy as sym
 
 from sympy.abc import E, I, L, M, P, q, x
 
 from symbeam.beam import beam
+from symbeam.load import distributed_load
 
 
 def test_beam_two_symbols():
@@ -40,6 +42,16 @@ def test_repeated_support():
         a.add_support(0, "pin")
 
 
+def test_repeated_support_distinct_expressions():
+    """Test if an error is raised when a repeated support is specified with a distinct, but
+    numerically equivalent, expression.
+    """
+    a = beam("l")
+    a.add_support("l/2", "pin")
+    with pytest.raises(RuntimeError):
+        a.add_support("0.5*l", "roller")
+
+
 def test_support_inside_beam():
     """Test if an error is raised when the supports lies outside the beam."""
     with pytest.raises(RuntimeError):
@@ -630,6 +642,90 @@ def test_discontinuous_properties():
     assert not errors, "The following errors ocurred:\n{}".format("\n".join(errors))
 
 
+def test_point_loads_matching():
+    """Test if the point loads and moments are only applied on the points at their
+    coordinates.
+    """
+    a = beam(L)
+    a.add_support(0, "fixed")
+    a.add_point_load(L / 4, -P)
+    a.add_point_load(3 * L / 4, 2 * P)
+    a.add_point_moment(L / 2, M)
+    a.solve(output=False)
+
+    assert [ipoint.external_force for ipoint in a.points] == [0, -P, 0, 2 * P, 0]
+    assert [ipoint.external_moment for ipoint in a.points] == [0, 0, M, 0, 0]
+
+
+def test_add_point_loads_bulk():
+    """Test if several point loads added at once match the ones added individually."""
+    a = beam(L)
+    a.add_support(0, "fixed")
+    a.add_point_load(L / 2, -P)
+    a.add_point_load(L, 2 * P)
+    a.solve(output=False)
+
+    b = beam(L)
+    b.add_support(0, "fixed")
+    b.add_point_loads_bulk([L / 2, L], [-P, 2 * P])
+    b.solve(output=False)
+
+    assert all(
+        isegment_a.bending_moment == isegment_b.bending_moment
+        for isegment_a, isegment_b in zip(a.segments, b.segments)
+    )
+
+    with pytest.raises(RuntimeError):
+        b.add_point_loads_bulk([L / 2, 2 * L], [-P, P])
+
+
+def test_distributed_load_as_numeric():
+    """Test the numeric evaluation of distributed loads."""
+    x_numeric = np.linspace(0.0, 2.0, num=5)
+
+    linear = distributed_load(0, 2, "3*x + 1")
+    assert np.allclose(linear.as_numeric()(x_numeric), 3.0 * x_numeric + 1.0)
+
+    constant = distributed_load(0, 2, "-5")
+    assert np.allclose(constant.as_numeric()(x_numeric), -5.0)
+
+    with pytest.raises(RuntimeError):
+        distributed_load(0, 2, "q*x").as_numeric()
+
+
+def test_distributed_load_equivalent_loads():
+    """Test the resultants of distributed loads, integrated or assigned."""
+    load = distributed_load(0, L, q)
+    assert load.equivalent_force == L * q
+    assert load.equivalent_moment == L**2 * q / 2
+
+    load.equivalent_force = P
+    assert load.equivalent_force == P
+    assert load.equivalent_moment == L**2 * q / 2
+
+
+def test_compile_numeric():
+    """Test the numeric functions of the solution of a cantilever beam."""
+    a = beam(L)
+    a.add_support(0, "fixed")
+    a.add_point_load(L, P)
+    with pytest.raises(RuntimeError):
+        a.compile_numeric()
+
+    a.solve(output=False, deflection=False)
+    with pytest.raises(RuntimeError):
+        a.compile_numeric(subs={L: 2})
+
+    (function,) = a.compile_numeric(subs={L: 2, P: 3, E: 1, I: 1})
+    x_numeric = np.linspace(0.0, 2.0, num=5)
+    values = function(x_numeric)
+    assert values.shape == (5, 5)
+    assert np.allclose(values[0], 0.0)
+    assert np.allclose(values[1], 3.0)
+    assert np.allclose(values[2], 6.0 - 3.0 * x_numeric)
+    assert np.allclose(values[4], 3.0 * x_numeric**2 - x_numeric**3 / 2.0)
+
+
 @pytest.mark.mpl_image_compare(baseline_dir="baseline", remove_text=True, tolerance=0.1)
 def test_plot_point_loads():
     """Test the plotting function for pins, rollers, hinges  and point forces and moments.
@@ -673,3 +769,64 @@ def test_plot_distributed_loads_fixed_right():
     a.solve()
     fig, ax = a.plot(subs={"q": 1000})
     return fig
+
+
+def test_solve_without_deflection():
+    """Test if the deflections are skipped on request and solved lazily when plotting."""
+    a = beam(L)
+    a.add_support(0, "fixed")
+    a.add_point_load(L, -P)
+    a.solve(output=False, deflection=False)
+
+    errors = []
+    if a.deflection_solved or a.segments[0].deflection != 0:
+        errors.append("The deflections have been solved.")
+    if a.segments[0].bending_moment != -L * P + P * x:
+        errors.append("Error in bending moment diagram.")
+
+    a.plot(subs={"P": 1000, "L": 2})
+    deflection = -L * P * x**2 / (2 * E * I) + P * x**3 / (6 * E * I)
+    if not a.deflection_solved or a.segments[0].deflection != deflection:
+        errors.append("The deflections have not been solved when plotting.")
+
+    # An empty list is False for Python
+    assert not errors, "The following errors ocurred:\n{}".format("\n".join(errors))
+
+
+def test_solve_again():
+    """Test if a beam can be solved again, before and after adding a load."""
+    a = beam(L)
+    a.add_support(0, "fixed")
+    a.add_point_load(L, -P)
+    a.solve(output=False)
+    a.solve(output=False)
+
+    errors = []
+    if len(a.points) != 2 or len(a.segments) != 1:
+        errors.append("The points and segments of the previous solution have been kept.")
+    if a.points[0].reaction_force != P:
+        errors.append("Error in the reaction force.")
+
+    a.add_point_load(L / 2, -P)
+    a.solve(output=False)
+    if len(a.points) != 3 or len(a.segments) != 2:
+        errors.append("Error in the points and segments after adding a load.")
+    if a.points[0].reaction_force != 2 * P:
+        errors.append("Error in the reaction force after adding a load.")
+    if a.points[0].reaction_moment != 3 * L * P / 2:
+        errors.append("Error in the reaction moment after adding a load.")
+
+    # An empty list is False for Python
+    assert not errors, "The following errors ocurred:\n{}".format("\n".join(errors))
+
+
+def test_plot_keeps_substitutions():
+    """Test if the user substitutions are not modified when plotting."""
+    a = beam(L)
+    a.add_support(0, "fixed")
+    a.add_point_load(L, -P)
+    a.solve(output=False)
+
+    subs = {"P": 1000, "L": 2, "x": 1}
+    a.plot(subs=subs)
+    assert subs == {"P": 1000, "L": 2, "x": 1}